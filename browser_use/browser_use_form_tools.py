@@ -3,6 +3,7 @@ Browser-Use Form Filling Tools
 Integrates advanced form filling logic with Browser-Use framework
 """
 
+import asyncio
 import os
 import json
 from pathlib import Path
@@ -19,6 +20,16 @@ from .modules.date_picker_filler import DatePickerFiller
 from .modules.file_upload_filler import FileUploadFiller
 from .modules.radio_filler import RadioFieldFiller
 from .modules.checkbox_filler import CheckboxFieldFiller
+from .modules.utils import (
+    COOKIE_BANNER_SELECTOR, COOKIE_WRAPPER_SELECTOR, PRUNE_DOM_JS,
+    block_heavy_resources, install_anchor_scroller, screenshot_form, scroll_to_anchor,
+    unblock_heavy_resources, wait_for_submit_outcome,
+)
+
+
+# Anything FormFiller can fill; waiting for it replaces fixed sleeps after navigation
+FORM_FIELD_SELECTOR = 'input, select, textarea, [role="combobox"], [role="textbox"]'
+FORM_FIELDS_PRESENT_JS = '() => document.querySelectorAll("input, select, textarea").length > 0'
 
 
 # Pydantic model for tool parameters
@@ -52,6 +63,9 @@ async def fill_web_form(
     Returns:
         ActionResult with success status and message
     """
+    # Context whose heavy resources this call blocked; the agent's context is shared, so the
+    # route is removed again once the form is done
+    blocked_context = None
     try:
         # Get Playwright page from browser session
         page = browser_session.must_get_current_page()
@@ -69,120 +83,119 @@ async def fill_web_form(
         # Navigate to URL if not already there
         current_url = page.url
         if current_url != action.url:
+            # Skip downloading images, fonts and media; none of it is needed to fill the form
+            if not getattr(page.context, '_autoff_blocking', False):
+                await block_heavy_resources(page.context)
+                blocked_context = page.context
+            await install_anchor_scroller(page.context)
             print(f'🌐 Navigating to: {action.url}')
+            # Return on commit; the form wait below gates on actual form presence
             await page.goto(
                 action.url,
-                wait_until='domcontentloaded',
+                wait_until='commit',
                 timeout=90000
             )
             
-            # Wait for page to load
-            wait_timeout = form_filler.config.get('settings', {}).get('wait_timeout', 5000)
-            await page.wait_for_timeout(wait_timeout)
+            # Wait for form elements instead of a fixed settings.wait_timeout delay
+            try:
+                await page.wait_for_selector(FORM_FIELD_SELECTOR, state='attached', timeout=30000)
+            except Exception:
+                print('⚠️  No form elements found yet, continuing')
         
         # Handle cookie consent
         cookie_handled = False
         cookie_does_not_exist = False
         
-        for attempt in range(1, 6):
-            if attempt > 1:
-                print(f'⏳ Waiting 2 seconds before checking cookie consent (attempt {attempt}/5)...')
-                await page.wait_for_timeout(2000)
-            
-            print(f'🍪 Checking for cookie consent (attempt {attempt}/5)...')
-            result = await form_filler._handle_cookie_consent()
-            
-            if result is None:
-                print('ℹ️  Cookie consent popup does not exist on this page')
-                cookie_does_not_exist = True
-                break
-            elif result is True:
-                cookie_handled = True
-                print('⏳ Waiting for cookie popup to fully close...')
-                await page.wait_for_timeout(2000)
-                break
+        # No wrapper within 1.5s means no popup; otherwise retry with a short exponential backoff
+        try:
+            await page.wait_for_selector(COOKIE_WRAPPER_SELECTOR, timeout=1500)
+        except Exception:
+            print('ℹ️  Cookie consent popup does not exist on this page')
+            cookie_does_not_exist = True
+        
+        if not cookie_does_not_exist:
+            for attempt in range(5):
+                if attempt > 0:
+                    await asyncio.sleep(0.1 * 2 ** attempt)
+                
+                print(f'🍪 Checking for cookie consent (attempt {attempt + 1}/5)...')
+                result = await form_filler._handle_cookie_consent()
+                
+                if result is None:
+                    print('ℹ️  Cookie consent popup does not exist on this page')
+                    cookie_does_not_exist = True
+                    break
+                elif result is True:
+                    cookie_handled = True
+                    break
         
         # If URL has anchor, scroll to it
         if '#' in action.url:
             anchor = action.url.split('#')[1]
             print(f'📍 Scrolling to anchor: #{anchor}')
             try:
-                await page.evaluate(f"""
-                    (anchorId) => {{
-                        let element = document.getElementById(anchorId);
-                        if (!element) {{
-                            element = document.querySelector(`[name="${{anchorId}}"]`);
-                        }}
-                        if (!element) {{
-                            element = document.querySelector(`a[name="${{anchorId}}"]`);
-                        }}
-                        if (!element) {{
-                            element = document.querySelector(`form#${{anchorId}}`);
-                        }}
-                        if (!element) {{
-                            element = document.querySelector(`form[name="${{anchorId}}"]`);
-                        }}
-                        if (!element) {{
-                            element = document.querySelector(`[id*="${{anchorId}}"], [name*="${{anchorId}}"]`);
-                        }}
-                        if (element) {{
-                            element.scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-                            return true;
-                        }}
-                        return false;
-                    }}
-                """, anchor)
-                await page.wait_for_timeout(2000)
+                await scroll_to_anchor(page, anchor)
             except Exception as e:
                 print(f'⚠️  Could not scroll to anchor: {str(e)}')
         
         # Wait for form to be visible
-        if cookie_handled:
-            print('⏳ Waiting for form to load after cookie consent...')
-            await page.wait_for_timeout(3000)
+        # Only run a second consent pass if a banner is still showing
+        if cookie_handled and await page.locator(COOKIE_BANNER_SELECTOR).count() > 0:
+            print('⏳ Cookie banner still visible, handling it again...')
             await form_filler._handle_cookie_consent()
-            await page.wait_for_timeout(2000)
+        
+        # Make sure fields have rendered before filling
+        try:
+            await page.wait_for_function(FORM_FIELDS_PRESENT_JS, timeout=10000)
+        except Exception:
+            print('⚠️  Form fields did not render in time, filling what is there')
         
         # Check for iframes
         iframes = await page.locator('iframe').all()
         if iframes:
             print(f'🔍 Found {len(iframes)} iframe(s), checking for forms inside...')
-            for i, iframe in enumerate(iframes):
-                try:
-                    frame = await iframe.content_frame()
-                    if frame:
-                        iframe_form_fields = await frame.evaluate("""
-                            () => {
-                                return Array.from(document.querySelectorAll('input, select, textarea')).length;
-                            }
-                        """)
-                        print(f'   Iframe {i + 1}: {iframe_form_fields} form fields found')
-                except Exception:
-                    pass
+            # Probe all iframes concurrently; cross-origin frames can be slow to answer
+            async def probe(i, iframe):
+                frame = await iframe.content_frame()
+                if frame:
+                    iframe_form_fields = await frame.evaluate("""
+                        () => {
+                            return Array.from(document.querySelectorAll('input, select, textarea')).length;
+                        }
+                    """)
+                    print(f'   Iframe {i + 1}: {iframe_form_fields} form fields found')
+            
+            await asyncio.gather(*(probe(i, iframe) for i, iframe in enumerate(iframes)), return_exceptions=True)
+        
+        # Remove media and ad iframes so the field scans walk a smaller DOM
+        try:
+            await page.evaluate(PRUNE_DOM_JS)
+        except Exception:
+            pass
         
         # Fill all form fields
         await form_filler.fill_all_fields()
         
         # Take screenshot
         screenshot_path = 'form_filled.png'
-        await page.screenshot(path=screenshot_path, full_page=True)
+        await screenshot_form(page, screenshot_path)
         print(f'📸 Screenshot saved: {screenshot_path}')
         
         # Submit form if requested
         if action.auto_submit:
             await form_filler._submit_form()
-            await page.wait_for_timeout(3000)
+            outcome = await wait_for_submit_outcome(page)
             print('Form submitted')
             
-            # Check for validation errors and try to fix them
-            print('\n[INFO] Checking for validation errors...')
-            fixed = await form_filler._smart_error_recovery()
-            if fixed:
-                print('[INFO] Errors were fixed, waiting before resubmitting...')
-                await page.wait_for_timeout(2000)
-                await form_filler._submit_form()
-                await page.wait_for_timeout(3000)
-                print('Form resubmitted after error recovery')
+            # Only a visible validation error is worth a recovery pass
+            if outcome == 'error':
+                print('\n[INFO] Validation errors found, trying to fix them...')
+                fixed = await form_filler._smart_error_recovery()
+                if fixed:
+                    print('[INFO] Errors were fixed, resubmitting...')
+                    await form_filler._submit_form()
+                    await wait_for_submit_outcome(page)
+                    print('Form resubmitted after error recovery')
             
             # Check for success message or errors
             try:
@@ -236,6 +249,12 @@ async def fill_web_form(
             success=False,
             result=error_message
         )
+    finally:
+        if blocked_context is not None:
+            try:
+                await unblock_heavy_resources(blocked_context)
+            except Exception:
+                pass
 
 
 # Example usage function
@@ -258,8 +277,6 @@ async def example_usage():
 
 
 if __name__ == "__main__":
-    import asyncio
-    
     # Run example
     asyncio.run(example_usage())
 
@@ -11,6 +11,7 @@ from .text_filler import TextFieldFiller
 from .radio_filler import RadioFieldFiller
 from .checkbox_filler import CheckboxFieldFiller
 from .field_detector import FieldDetector
+from .browser_pool import BrowserPool
 
 __all__ = [
     'FormFiller',
@@ -21,5 +22,6 @@ __all__ = [
     'RadioFieldFiller',
     'CheckboxFieldFiller',
     'FieldDetector',
+    'BrowserPool',
 ]
 
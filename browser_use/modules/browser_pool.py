@@ -0,0 +1,127 @@
+"""
+Browser Pool Module
+Keeps launched Chromium instances warm and hands them out per form run
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Dict
+
+from playwright.async_api import async_playwright
+
+# A browser is closed and relaunched after serving this many runs, so long-lived
+# processes don't accumulate renderer memory
+BROWSER_POOL_RECYCLE_AFTER = 100
+
+
+# Process-wide Playwright driver, started on first use
+_pw = None
+_pw_lock = None
+
+
+async def get_pw():
+    """
+    Return the shared async Playwright instance, starting its driver on the first call
+    Every run in the process reuses the same driver subprocess instead of spawning one
+    """
+    global _pw, _pw_lock
+    if _pw is None:
+        if _pw_lock is None:
+            _pw_lock = asyncio.Lock()
+        async with _pw_lock:
+            if _pw is None:
+                _pw = await async_playwright().start()
+    return _pw
+
+
+async def stop_pw() -> None:
+    """Stop the shared Playwright driver; call once when the process is done with it"""
+    global _pw
+    if _pw is not None:
+        pw, _pw = _pw, None
+        await pw.stop()
+
+
+class BrowserPool:
+    """
+    Pool of pre-launched Chromium browsers
+    
+    Usage:
+        pool = BrowserPool(playwright, size=4, headless=True)
+        await pool.start()
+        async with pool.acquire() as browser:
+            context = await browser.new_context(...)
+        await pool.close()
+    """
+    
+    def __init__(self, playwright, size: int = 4, recycle_after: int = BROWSER_POOL_RECYCLE_AFTER, **launch_options: Any):
+        """
+        Args:
+            playwright: Started async Playwright instance
+            size: Number of browsers kept in the pool
+            recycle_after: Runs served by one browser before it is relaunched
+            launch_options: Passed to playwright.chromium.launch()
+        """
+        self.playwright = playwright
+        self.size = size
+        self.recycle_after = recycle_after
+        self.launch_options = launch_options
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._uses: Dict[Any, int] = {}
+        self._started = False
+    
+    async def _launch(self):
+        browser = await self.playwright.chromium.launch(**self.launch_options)
+        self._uses[browser] = 0
+        return browser
+    
+    async def start(self) -> None:
+        """Launch all browsers of the pool concurrently"""
+        if self._started:
+            return
+        self._started = True
+        browsers = await asyncio.gather(*(self._launch() for _ in range(self.size)))
+        for browser in browsers:
+            self._idle.put_nowait(browser)
+    
+    async def _retire(self, browser) -> None:
+        self._uses.pop(browser, None)
+        try:
+            await browser.close()
+        except Exception:
+            pass
+    
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Check out a browser for one run; waits while all browsers are busy
+        A slot whose browser disconnected or reached recycle_after runs is left empty on
+        release and gets a new browser only when it is acquired again
+        """
+        await self.start()
+        browser = await self._idle.get()
+        if browser is None or not browser.is_connected():
+            if browser is not None:
+                await self._retire(browser)
+            try:
+                browser = await self._launch()
+            except BaseException:
+                # Give the slot back, or later acquire() calls would wait forever
+                self._idle.put_nowait(None)
+                raise
+        try:
+            yield browser
+        finally:
+            self._uses[browser] = self._uses.get(browser, 0) + 1
+            if not browser.is_connected() or self._uses[browser] >= self.recycle_after:
+                await self._retire(browser)
+                browser = None
+            self._idle.put_nowait(browser)
+    
+    async def close(self) -> None:
+        """Close every idle browser of the pool"""
+        while not self._idle.empty():
+            browser = self._idle.get_nowait()
+            if browser is not None:
+                await self._retire(browser)
+        self._started = False
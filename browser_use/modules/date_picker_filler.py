@@ -3,9 +3,12 @@ Date Picker Filler Module
 Handles date inputs and datepicker widgets
 """
 
+import logging
 from typing import List
 from .utils import normalize_date, validate_date, get_date_formats
 
+logger = logging.getLogger(__name__)
+
 
 class DatePickerFiller:
     """
@@ -23,7 +26,7 @@ class DatePickerFiller:
             return False
         
         year, month, day = parts
-        print(f'📅 Normalized date: {normalized_date} (Year: {year}, Month: {month}, Day: {day})')
+        logger.debug('📅 Normalized date: %s (Year: %s, Month: %s, Day: %s)', normalized_date, year, month, day)
         
         for selector in selectors:
             try:
@@ -68,7 +71,7 @@ class DatePickerFiller:
                 continue
         
         # Try smart detection if direct selectors failed
-        print(f'⚠️  Date field not found with provided selectors, trying smart detection...')
+        logger.debug('⚠️  Date field not found with provided selectors, trying smart detection...')
         return await DatePickerFiller._smart_date_picker_detection(page, date_value, field_name)
     
     @staticmethod
@@ -85,24 +88,23 @@ class DatePickerFiller:
             return True
         
         # Strategy 2: Calendar selection with 1-based month index
-        print(f'🔄 Retrying with 1-based month index...')
+        logger.debug('🔄 Retrying with 1-based month index...')
         success = await DatePickerFiller._try_calendar_selection(page, locator, year, month, day, month_num, day_num, 1, field_name)
         if success:
             return True
         
         # Strategy 3: Direct fill with different formats
-        print(f'🔄 Retrying with direct fill...')
+        logger.debug('🔄 Retrying with direct fill...')
         formats = get_date_formats(year, month, day)
         for date_format in formats:
             try:
-                await locator.clear()
                 await locator.fill(date_format)
                 await page.wait_for_timeout(200)
                 await page.keyboard.press('Tab')
                 await page.wait_for_timeout(200)
                 
                 current_value = await locator.input_value()
-                if validate_date(current_value, f'{year}-{month}-{day}', year, month, day):
+                if validate_date(current_value, f'{year}-{month}-{day}', year, month_num, day_num):
                     print(f'✅ {field_name}: \'{current_value}\' (direct fill)')
                     return True
             except Exception:
@@ -126,11 +128,11 @@ class DatePickerFiller:
                 await page.wait_for_timeout(300)
                 current_value = await locator.input_value()
                 
-                if validate_date(current_value, f'{year}-{month}-{day}', year, month, day):
+                if validate_date(current_value, f'{year}-{month}-{day}', year, month_num, day_num):
                     print(f'✅ {field_name}: \'{current_value}\' (calendar, {"0-based" if month_index_offset == 0 else "1-based"})')
                     return True
                 else:
-                    print(f'⚠️  Validation failed: expected date with {year}-{month}-{day}, got \'{current_value}\'')
+                    logger.debug("⚠️  Validation failed: expected date with %s-%s-%s, got '%s'", year, month, day, current_value)
         except Exception:
             pass
         
@@ -159,7 +161,7 @@ class DatePickerFiller:
                     calendar = page.locator(cal_selector).first
                     await calendar.wait_for(state='visible', timeout=1000)
                     if await calendar.count() > 0:
-                        print(f'📅 Calendar found, selecting year: {year}, month: {month}, day: {day}')
+                        logger.debug('📅 Calendar found, selecting year: %s, month: %s, day: %s', year, month, day)
                         
                         # Step 1: Select year (if dropdown exists)
                         try:
@@ -179,14 +181,14 @@ class DatePickerFiller:
                                         # Try to select year
                                         try:
                                             await year_element.select_option(value=year)
-                                            print(f'✅ Year selected: {year}')
+                                            logger.debug('✅ Year selected: %s', year)
                                             await page.wait_for_timeout(200)
                                             break
                                         except Exception:
                                             # Try by text
                                             try:
                                                 await year_element.select_option(label=year)
-                                                print(f'✅ Year selected by label: {year}')
+                                                logger.debug('✅ Year selected by label: %s', year)
                                                 await page.wait_for_timeout(200)
                                                 break
                                             except Exception:
@@ -238,49 +240,49 @@ class DatePickerFiller:
                                         try:
                                             month_index = month_num - 1 + month_index_offset
                                             await month_element.select_option(index=month_index)
-                                            print(f'✅ Month selected by index ({"0-based" if month_index_offset == 0 else "1-based"}): {month_index} = month {month_num}')
+                                            logger.debug('✅ Month selected by index (%s): %s = month %s', '0-based' if month_index_offset == 0 else '1-based', month_index, month_num)
                                             await page.wait_for_timeout(300)
                                             month_selected = True
                                         except Exception:
                                             # Method 2: Try by value with zero-padding
                                             try:
                                                 await month_element.select_option(value=month)
-                                                print(f'✅ Month selected by value (padded): {month}')
+                                                logger.debug('✅ Month selected by value (padded): %s', month)
                                                 await page.wait_for_timeout(300)
                                                 month_selected = True
                                             except Exception:
                                                 # Method 3: Try by value without padding
                                                 try:
                                                     await month_element.select_option(value=str(month_num))
-                                                    print(f'✅ Month selected by value: {month_num}')
+                                                    logger.debug('✅ Month selected by value: %s', month_num)
                                                     await page.wait_for_timeout(300)
                                                     month_selected = True
                                                 except Exception:
                                                     # Method 4: Try by label (German short name first)
                                                     try:
                                                         await month_element.select_option(label=month_short_name_de)
-                                                        print(f'✅ Month selected by short (DE): {month_short_name_de}')
+                                                        logger.debug('✅ Month selected by short (DE): %s', month_short_name_de)
                                                         await page.wait_for_timeout(300)
                                                         month_selected = True
                                                     except Exception:
                                                         # Method 5: Try by label (English short name)
                                                         try:
                                                             await month_element.select_option(label=month_short_name)
-                                                            print(f'✅ Month selected by short (EN): {month_short_name}')
+                                                            logger.debug('✅ Month selected by short (EN): %s', month_short_name)
                                                             await page.wait_for_timeout(300)
                                                             month_selected = True
                                                         except Exception:
                                                             # Method 6: Try by label (German full name)
                                                             try:
                                                                 await month_element.select_option(label=month_name_de)
-                                                                print(f'✅ Month selected by label (DE): {month_name_de}')
+                                                                logger.debug('✅ Month selected by label (DE): %s', month_name_de)
                                                                 await page.wait_for_timeout(300)
                                                                 month_selected = True
                                                             except Exception:
                                                                 # Method 7: Try by label (English full name)
                                                                 try:
                                                                     await month_element.select_option(label=month_name)
-                                                                    print(f'✅ Month selected by label (EN): {month_name}')
+                                                                    logger.debug('✅ Month selected by label (EN): %s', month_name)
                                                                     await page.wait_for_timeout(300)
                                                                     month_selected = True
                                                                 except Exception:
@@ -311,7 +313,7 @@ class DatePickerFiller:
                                 day_element = page.locator(day_selector).first
                                 if await day_element.is_visible():
                                     await day_element.click()
-                                    print(f'✅ Day selected: {day_num}')
+                                    logger.debug('✅ Day selected: %s', day_num)
                                     await page.wait_for_timeout(200)
                                     return True
                             except Exception:
@@ -319,7 +321,7 @@ class DatePickerFiller:
                 except Exception:
                     continue
         except Exception as e:
-            print(f'⚠️  Calendar selection error: {str(e)}')
+            logger.debug('⚠️  Calendar selection error: %s', e)
         
         return False
     
@@ -347,7 +349,7 @@ class DatePickerFiller:
                     if label_for:
                         input_locator = page.locator(f'#{label_for}').first
                         if await input_locator.is_visible():
-                            print(f'✅ Found field by label "for" attribute: #{label_for}')
+                            logger.debug('✅ Found field by label "for" attribute: #%s', label_for)
                             filled = await DatePickerFiller.fill(page, [f'#{label_for}'], date_value, field_name)
                             if filled:
                                 return True
@@ -355,7 +357,7 @@ class DatePickerFiller:
                 # Try by aria-label
                 aria_input = page.locator(f'input[aria-label*="{term}" i]').first
                 if await aria_input.is_visible():
-                    print(f'✅ Found field by aria-label')
+                    logger.debug('✅ Found field by aria-label')
                     filled = await DatePickerFiller.fill(page, [f'input[aria-label*="{term}" i]'], date_value, field_name)
                     if filled:
                         return True
@@ -367,7 +369,7 @@ class DatePickerFiller:
                     field_id = await name_input.get_attribute('id')
                     selector = f'input[name="{name}"]' if name else (f'input[id="{field_id}"]' if field_id else None)
                     if selector:
-                        print(f'✅ Found field by name/id: {selector}')
+                        logger.debug('✅ Found field by name/id: %s', selector)
                         filled = await DatePickerFiller.fill(page, [selector], date_value, field_name)
                         if filled:
                             return True
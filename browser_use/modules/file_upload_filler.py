@@ -27,12 +27,14 @@ class FileUploadFiller:
         abs_path = resolve_file_path(file_path, base_dir=os.path.dirname(os.path.dirname(__file__)))
         print(f'   Absolute path: {abs_path}')
         
-        if not os.path.exists(abs_path):
+        # One stat answers both "does it exist" and "how big is it"
+        try:
+            file_size = os.stat(abs_path).st_size
+        except OSError:
             print(f'❌ File not found: {abs_path}')
             print(f'   Tried path: {file_path}')
             return False
         
-        file_size = os.path.getsize(abs_path)
         print(f'✅ File exists, size: {file_size} bytes')
         
         # Strategy 0: Direct search for input-group pattern with span _add
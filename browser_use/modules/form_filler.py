@@ -3,11 +3,13 @@ Form Filler Core Module
 Main FormFiller class that orchestrates form filling
 """
 
+import copy
 import json
 import os
 import re
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from pathlib import Path
+from urllib.parse import urlparse
 
 from .text_filler import TextFieldFiller
 from .select_filler import SelectFieldFiller
@@ -18,12 +20,38 @@ from .checkbox_filler import CheckboxFieldFiller
 from .field_detector import FieldDetector
 from .utils import resolve_file_path
 
+# Parsed config files keyed by (path, mtime); an edited file gets a new key
+_CONFIG_CACHE: Dict[Tuple[str, float], Dict[str, Any]] = {}
+
+
+# Everything _submit_form needs to know about a submit candidate, read in one round trip
+_SUBMIT_CANDIDATE_JS = """
+    el => {
+        const rect = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        return {
+            tag_name: el.tagName.toLowerCase(),
+            text: (el.textContent || '').trim(),
+            name: el.getAttribute('name'),
+            type: el.getAttribute('type'),
+            id: el.getAttribute('id'),
+            class: el.getAttribute('class') || '',
+            visible: rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden',
+            disabled: el.matches(':disabled') || el.getAttribute('aria-disabled') === 'true',
+            bottom: rect.y + rect.height
+        };
+    }
+"""
+
 
 class FormFiller:
     """
     Main class for automating form filling on web pages
     """
     
+    # Cookie button selector that worked last, per site (netloc); shared by all instances
+    _cookie_selector_cache: Dict[str, str] = {}
+    
     def __init__(self, config_path: str = "config.json", page=None):
         """
         Initialize FormFiller with configuration file
@@ -37,10 +65,16 @@ class FormFiller:
         self.page = page
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from JSON file"""
+        """Load configuration from JSON file, reusing the parsed result while the file is unchanged"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            key = (self.config_path, os.path.getmtime(self.config_path))
+            config = _CONFIG_CACHE.get(key)
+            if config is None:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+                _CONFIG_CACHE[key] = config
+            # Each FormFiller gets its own copy, so edits never leak into the cache
+            return copy.deepcopy(config)
         except FileNotFoundError:
             print(f"[ERROR] Config file not found: {self.config_path}")
             raise
@@ -59,6 +93,8 @@ class FormFiller:
         if not self.page:
             return None
         
+        netloc = urlparse(self.page.url).netloc
+        
         try:
             print('[INFO] Checking for cookie consent popup...')
             # Quick check: wait for cookie wrapper with short timeout
@@ -73,6 +109,19 @@ class FormFiller:
                 print('[INFO] No cookie consent popup found on this page')
                 return None
             
+            # Accept button that worked before on this site, only if it is showing now
+            cached_selector = FormFiller._cookie_selector_cache.get(netloc)
+            if cached_selector:
+                try:
+                    button = self.page.locator(cached_selector).first
+                    if await button.is_visible():
+                        await button.click(timeout=500)
+                        print('[OK] Cookie consent accepted (cached selector)')
+                        await self.page.wait_for_timeout(1000)
+                        return True
+                except Exception:
+                    pass
+            
             # Cookie wrapper exists, check for buttons
             cookie_selectors = [
                 'button:has-text("Alle akzeptieren")',
@@ -96,6 +145,7 @@ class FormFiller:
                         if is_visible:
                             await button.scroll_into_view_if_needed()
                             await button.click()
+                            FormFiller._cookie_selector_cache[netloc] = selector
                             print('[OK] Cookie consent accepted')
                             await self.page.wait_for_timeout(1000)
                             return True
@@ -2442,76 +2492,56 @@ class FormFiller:
                 'a[onclick*="submit"]'
             ]
             
+            # One locator for the whole list: a single query finds every candidate once,
+            # instead of one query per selector and duplicates for buttons matching several
+            candidates = await self.page.locator(', '.join(submit_selectors)).all()
+            print(f'[DEBUG] Submit selectors: found {len(candidates)} element(s)')
+            
             all_buttons = []
-            for selector in submit_selectors:
+            for element in candidates:
                 try:
-                    elements = await self.page.locator(selector).all()
-                    print(f'[DEBUG] Submit selector "{selector}": found {len(elements)} element(s)')
-                    for element in elements:
-                        try:
-                            is_visible = await element.is_visible()
-                            if is_visible:
-                                # Get element tag name to distinguish between button and link
-                                tag_name = await element.evaluate('el => el.tagName.toLowerCase()')
-                                is_link = tag_name == 'a'
-                                
-                                # Get element text to filter out "Hinzufügen" (Add) buttons
-                                element_text = await element.text_content()
-                                element_text = element_text.strip() if element_text else ''
-                                element_name = await element.get_attribute('name')
-                                element_type = await element.get_attribute('type')
-                                element_id = await element.get_attribute('id')
-                                element_class = await element.get_attribute('class') or ''
-                                
-                                print(f'[DEBUG] Found element ({tag_name}): text="{element_text}", name="{element_name}", type="{element_type}", id="{element_id}"')
-                                
-                                if element_text and 'hinzufügen' not in element_text.lower() and 'add' not in element_text.lower():
-                                    # For links, check if they look like submit buttons
-                                    if is_link:
-                                        # Check if link has submit-related text or classes
-                                        has_submit_text = any(word in element_text.lower() for word in ['absenden', 'submit', 'senden', 'abschicken'])
-                                        has_submit_class = 'btn-primary' in element_class or 'submit' in element_class.lower()
-                                        
-                                        if has_submit_text or has_submit_class or element_id == 'submitButton':
-                                            print(f'[DEBUG] Link looks like submit button: has_submit_text={has_submit_text}, has_submit_class={has_submit_class}')
-                                            rect = await element.bounding_box()
-                                            if rect:
-                                                all_buttons.append({
-                                                    'button': element,
-                                                    'y': rect['y'] + rect['height'],
-                                                    'text': element_text,
-                                                    'is_disabled': False,  # Links don't have disabled state
-                                                    'has_opacity': False,
-                                                    'is_link': True,
-                                                    'tag_name': tag_name
-                                                })
-                                    else:
-                                        # For buttons, check if disabled
-                                        is_disabled = await element.is_disabled()
-                                        disabled_attr = await element.get_attribute('disabled')
-                                        
-                                        # opacity-50 might indicate disabled, but we should still try
-                                        has_opacity = 'opacity-50' in element_class
-                                        
-                                        print(f'[DEBUG] Button disabled check: is_disabled={is_disabled}, disabled_attr={disabled_attr}, has_opacity={has_opacity}')
-                                        
-                                        # Get position
-                                        rect = await element.bounding_box()
-                                        if rect:
-                                            all_buttons.append({
-                                                'button': element,
-                                                'y': rect['y'] + rect['height'],
-                                                'text': element_text,
-                                                'is_disabled': is_disabled,
-                                                'has_opacity': has_opacity,
-                                                'is_link': False,
-                                                'tag_name': tag_name
-                                            })
-                        except Exception as e:
-                            print(f'[DEBUG] Error checking element: {str(e)}')
+                    info = await element.evaluate(_SUBMIT_CANDIDATE_JS)
+                    if not info['visible']:
+                        continue
+                    
+                    tag_name = info['tag_name']
+                    is_link = tag_name == 'a'
+                    element_text = info['text']
+                    element_class = info['class']
+                    element_id = info['id']
+                    
+                    print(f'[DEBUG] Found element ({tag_name}): text="{element_text}", name="{info["name"]}", type="{info["type"]}", id="{element_id}"')
+                    
+                    # Filter out "Hinzufügen" (Add) buttons
+                    if not element_text or 'hinzufügen' in element_text.lower() or 'add' in element_text.lower():
+                        continue
+                    
+                    if is_link:
+                        # For links, check if they look like submit buttons
+                        has_submit_text = any(word in element_text.lower() for word in ['absenden', 'submit', 'senden', 'abschicken'])
+                        has_submit_class = 'btn-primary' in element_class or 'submit' in element_class.lower()
+                        if not (has_submit_text or has_submit_class or element_id == 'submitButton'):
                             continue
+                        print(f'[DEBUG] Link looks like submit button: has_submit_text={has_submit_text}, has_submit_class={has_submit_class}')
+                        is_disabled = False  # Links don't have disabled state
+                        has_opacity = False
+                    else:
+                        is_disabled = info['disabled']
+                        # opacity-50 might indicate disabled, but we should still try
+                        has_opacity = 'opacity-50' in element_class
+                        print(f'[DEBUG] Button disabled check: is_disabled={is_disabled}, has_opacity={has_opacity}')
+                    
+                    all_buttons.append({
+                        'button': element,
+                        'y': info['bottom'],
+                        'text': element_text,
+                        'is_disabled': is_disabled,
+                        'has_opacity': has_opacity,
+                        'is_link': is_link,
+                        'tag_name': tag_name
+                    })
                 except Exception as e:
-                    print(f'[DEBUG] Error with selector "{selector}": {str(e)}')
+                    print(f'[DEBUG] Error checking element: {str(e)}')
                     continue
             
             # If no buttons found, try searching by text content (for both buttons and links)
@@ -3,6 +3,10 @@ Radio Button Filler Module
 Handles radio button groups
 """
 
+import logging
+
+logger = logging.getLogger(__name__)
+
 
 class RadioFieldFiller:
     """
@@ -15,7 +19,7 @@ class RadioFieldFiller:
         Select a radio button
         If locator is provided, use it to find the correct radio group by context
         """
-        print(f'[DEBUG] RadioFiller.fill called: name_selector="{name_selector}", value="{value}", field_name="{field_name}", field_label="{field_label}"')
+        logger.debug('RadioFiller.fill called: name_selector="%s", value="%s", field_name="%s", field_label="%s"', name_selector, value, field_name, field_label)
         
         # If we have the original locator, use it to find the correct radio group
         if locator:
@@ -50,7 +54,7 @@ class RadioFieldFiller:
                     
                     # Find all radios with this name
                     all_radios = await page.locator(f'input[type="radio"][name="{name}"]').all()
-                    print(f'[DEBUG] Found {len(all_radios)} radios with name="{name}"')
+                    logger.debug('Found %s radios with name="%s"', len(all_radios), name)
                     
                     # Try to find the radio that matches the value and is in the same container
                     for idx, radio in enumerate(all_radios):
@@ -79,7 +83,7 @@ class RadioFieldFiller:
                             # If containers match (or both are null), check if value matches
                             containers_match = container_info == radio_container or (not container_info and not radio_container)
                             if containers_match:
-                                print(f'[DEBUG] Container match for radio #{idx}')
+                                logger.debug('Container match for radio #%s', idx)
                                 radio_value = await radio.get_attribute('value')
                                 radio_id = await radio.get_attribute('id')
                                 
@@ -136,7 +140,7 @@ class RadioFieldFiller:
                                     for key, mapped_values in german_mappings.items():
                                         if key in value_lower:
                                             value_lower_mapped = mapped_values[0]  # Use first mapping
-                                            print(f'[DEBUG] Mapped "{value}" to "{value_lower_mapped}" for German level')
+                                            logger.debug('Mapped "%s" to "%s" for German level', value, value_lower_mapped)
                                             break
                                     
                                     # Check if any mapped value matches
@@ -145,7 +149,7 @@ class RadioFieldFiller:
                                         for mapped_val in german_mappings.get(value_lower, []):
                                             if mapped_val in label_lower or label_lower in mapped_val:
                                                 matches = True
-                                                print(f'[DEBUG] Match found via mapping: "{mapped_val}" in "{label_lower}"')
+                                                logger.debug('Match found via mapping: "%s" in "%s"', mapped_val, label_lower)
                                                 break
                                 
                                 # Remote work mappings
@@ -164,7 +168,7 @@ class RadioFieldFiller:
                                                 for mapped_val in mapped_values:
                                                     if mapped_val in label_lower or label_lower == mapped_val:
                                                         matches = True
-                                                        print(f'[DEBUG] Match found via remote mapping: "{mapped_val}" == "{label_lower}"')
+                                                        logger.debug('Match found via remote mapping: "%s" == "%s"', mapped_val, label_lower)
                                                         break
                                 
                                 # Standard matching (if not already matched)
@@ -188,11 +192,11 @@ class RadioFieldFiller:
                                         for word in label_words:
                                             if word in value_lower or value_lower in word:
                                                 matches = True
-                                                print(f'[DEBUG] Match found via word matching: "{word}" in "{value_lower}"')
+                                                logger.debug('Match found via word matching: "%s" in "%s"', word, value_lower)
                                                 break
                                 
                                 if matches:
-                                    print(f'[DEBUG] Match found! Radio #{idx}: value="{radio_value}", label="{radio_label_text}"')
+                                    logger.debug('Match found! Radio #%s: value="%s", label="%s"', idx, radio_value, radio_label_text)
                                     await radio.scroll_into_view_if_needed()
                                     await page.wait_for_timeout(100)
                                     await radio.check()
@@ -202,9 +206,9 @@ class RadioFieldFiller:
                                         print(f'[OK] {field_name}: \'{value}\' -> selected (value: {radio_value or "N/A"}, label: {radio_label_text or "N/A"})')
                                         return True
                                     else:
-                                        print(f'[DEBUG] Radio checked but is_checked() returned False')
+                                        logger.debug('Radio checked but is_checked() returned False')
                                 else:
-                                    print(f'[DEBUG] Radio #{idx} does not match: value="{radio_value}", label="{radio_label_text}", searching for="{value}"')
+                                    logger.debug('Radio #%s does not match: value="%s", label="%s", searching for="%s"', idx, radio_value, radio_label_text, value)
                         except Exception:
                             continue
             except Exception:
@@ -238,7 +242,7 @@ class RadioFieldFiller:
             
             if name:
                 # For names with special characters like [ and ], we need to use a different approach
-                print(f'[DEBUG] Fallback: Searching for name="{name}", value="{value}"')
+                logger.debug('Fallback: Searching for name="%s", value="%s"', name, value)
                 # Use evaluate to find radios by name attribute (handles special characters)
                 radio_indices = await page.evaluate(f"""
                     () => {{
@@ -264,7 +268,7 @@ class RadioFieldFiller:
                     except Exception:
                         continue
                 
-                print(f'[DEBUG] Fallback: Found {len(all_radios)} radios')
+                logger.debug('Fallback: Found %s radios', len(all_radios))
                 
                 value_lower = value.lower().strip()
                 
@@ -322,14 +326,14 @@ class RadioFieldFiller:
                         """)
                         
                         radio_value = await radio.get_attribute('value')
-                        print(f'[DEBUG] Fallback Radio #{idx}: value="{radio_value}", label="{radio_label}"')
+                        logger.debug('Fallback Radio #%s: value="%s", label="%s"', idx, radio_value, radio_label)
                         
                         # Check if label matches (exact or partial)
                         if radio_label:
                             label_lower = radio_label.lower().strip()
                             # Exact match
                             if label_lower == value_lower:
-                                print(f'[DEBUG] Fallback: Exact label match found!')
+                                logger.debug('Fallback: Exact label match found!')
                                 await radio.scroll_into_view_if_needed()
                                 await page.wait_for_timeout(100)
                                 await radio.check()
@@ -340,7 +344,7 @@ class RadioFieldFiller:
                                     return True
                             # Partial match - value in label
                             elif value_lower in label_lower:
-                                print(f'[DEBUG] Fallback: Partial label match found! (value in label)')
+                                logger.debug('Fallback: Partial label match found! (value in label)')
                                 await radio.scroll_into_view_if_needed()
                                 await page.wait_for_timeout(100)
                                 await radio.check()
@@ -351,7 +355,7 @@ class RadioFieldFiller:
                                     return True
                             # Partial match - label in value
                             elif label_lower in value_lower:
-                                print(f'[DEBUG] Fallback: Partial label match found! (label in value)')
+                                logger.debug('Fallback: Partial label match found! (label in value)')
                                 await radio.scroll_into_view_if_needed()
                                 await page.wait_for_timeout(100)
                                 await radio.check()
@@ -365,7 +369,7 @@ class RadioFieldFiller:
                         if radio_value:
                             radio_value_lower = radio_value.lower().strip()
                             if radio_value_lower == value_lower or value_lower in radio_value_lower or radio_value_lower in value_lower:
-                                print(f'[DEBUG] Fallback: Value match found!')
+                                logger.debug('Fallback: Value match found!')
                                 await radio.scroll_into_view_if_needed()
                                 await page.wait_for_timeout(100)
                                 await radio.check()
@@ -375,10 +379,10 @@ class RadioFieldFiller:
                                     print(f'[OK] {field_name}: \'{value}\' (fallback by value)')
                                     return True
                     except Exception as e:
-                        print(f'[DEBUG] Fallback error on radio #{idx}: {str(e)}')
+                        logger.debug('Fallback error on radio #%s: %s', idx, e)
                         continue
         except Exception as e:
-            print(f'[DEBUG] Fallback exception: {str(e)}')
+            logger.debug('Fallback exception: %s', e)
             pass
         
         # Try by label text, but only within the same name group
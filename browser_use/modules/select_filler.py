@@ -3,7 +3,94 @@ Select Field Filler Module
 Handles dropdown/select fields with intelligent value mapping
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+import logging
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Set
+from .utils import ensure_helpers
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=2048)
+def _normalize(text: str) -> str:
+    """
+    Normalize an option value/label for case-insensitive comparison
+    """
+    return text.strip().casefold() if text else ''
+
+
+def _partial_label_matches(needle: str, joined: str, offsets: List[int], labels: List[str]) -> Set[int]:
+    """
+    Get indices of labels that contain needle or are contained in it
+    joined is all labels joined with NUL and offsets the start of each label in it,
+    so forward matches come from C-level str.find instead of one scan per label
+    """
+    if not needle:
+        return set(range(len(labels)))
+    
+    matches = set()
+    pos = joined.find(needle)
+    while pos != -1:
+        idx = bisect_right(offsets, pos) - 1
+        matches.add(idx)
+        # Continue from the start of the next label
+        next_start = offsets[idx + 1] if idx + 1 < len(offsets) else len(joined)
+        pos = joined.find(needle, next_start)
+    
+    # Reverse direction: only labels not longer than the needle can be contained in it
+    needle_len = len(needle)
+    for idx, label in enumerate(labels):
+        if len(label) <= needle_len and label in needle:
+            matches.add(idx)
+    return matches
+
+
+# Direct DOM write for a native select: set the value, notify listeners, read it back.
+# The Angular hooks are only included for pages that actually load AngularJS.
+_DOM_SET_JS = """
+    (select, optionValue) => {
+        const value = String(optionValue);
+        const hasOption = !!(select && select.options) &&
+            Array.from(select.options).some(option => option.value === value);
+        
+        if (hasOption) {
+            select.value = value;
+            select.dispatchEvent(new Event('change', { bubbles: true, cancelable: true }));
+            select.dispatchEvent(new Event('input', { bubbles: true, cancelable: true }));
+            /*ANGULAR*/
+        }
+        
+        const current = select ? select.value : null;
+        return { ok: hasOption && current === value, value: current };
+    }
+"""
+
+_ANGULAR_JS = """
+            // Angular support: trigger ngModel change, then one digest
+            try {
+                if (select.attributes['ng-model']) {
+                    const scope = window.angular.element(select).scope();
+                    if (scope) {
+                        scope.$apply(function() {
+                            scope[select.attributes['ng-model'].value] = value;
+                        });
+                    }
+                }
+                const elem = window.angular.element(select);
+                if (elem && elem.injector) {
+                    const $rootScope = elem.injector().get('$rootScope');
+                    if ($rootScope) {
+                        $rootScope.$apply();
+                    }
+                }
+            } catch (e) {
+                console.log('Angular update failed:', e);
+            }"""
+
+_DOM_SET_JS_SIMPLE = _DOM_SET_JS.replace('/*ANGULAR*/', '')
+_DOM_SET_JS_ANGULAR = _DOM_SET_JS.replace('/*ANGULAR*/', _ANGULAR_JS)
 
 
 class SelectFieldFiller:
@@ -157,7 +244,7 @@ class SelectFieldFiller:
             
             # For bw-select-menu, get options from popover
             if is_bw_select:
-                print(f'   [GET_OPTIONS] Detected bw-select-menu, getting options from popover...')
+                logger.debug('[GET_OPTIONS] Detected bw-select-menu, getting options from popover...')
                 try:
                     # First, try to click button to open popover
                     await locator.click()
@@ -191,14 +278,14 @@ class SelectFieldFiller:
                     """)
                     
                     if options:
-                        print(f'   [GET_OPTIONS] Found {len(options)} options from bw-select-menu')
+                        logger.debug('[GET_OPTIONS] Found %s options from bw-select-menu', len(options))
                         return options
                     else:
                         # Close popover if no options found
                         await locator.page.keyboard.press('Escape')
                         await locator.page.wait_for_timeout(200)
                 except Exception as e:
-                    print(f'   [GET_OPTIONS] Error getting bw-select-menu options: {str(e)}')
+                    logger.debug('[GET_OPTIONS] Error getting bw-select-menu options: %s', e)
                     # Close popover if error
                     try:
                         await locator.page.keyboard.press('Escape')
@@ -208,7 +295,7 @@ class SelectFieldFiller:
             
             # For custom select, get options from both select and div.form__selectbox-option
             if tag_name == 'input' and input_type == 'text' and data_placeholder:
-                print(f'   [GET_OPTIONS] Custom select detected, getting options from div.form__selectbox-option...')
+                logger.debug('[GET_OPTIONS] Custom select detected, getting options from div.form__selectbox-option...')
                 # Find container and get options from both select and div
                 options = await locator.page.evaluate("""
                     (input) => {
@@ -255,7 +342,7 @@ class SelectFieldFiller:
                         return opts;
                     }
                 """, await locator.element_handle())
-                print(f'   [GET_OPTIONS] Found {len(options)} options from custom select')
+                logger.debug('[GET_OPTIONS] Found %s options from custom select', len(options))
                 return options if options else []
             
             # Regular select - get options from select element
@@ -314,10 +401,25 @@ class SelectFieldFiller:
                     """, selector)
                     return options if options else []
             except Exception as e2:
-                print(f'   Alternative method error: {str(e2)}')
+                logger.debug('Alternative method error: %s', e2)
                 pass
             return []
     
+    @staticmethod
+    async def _read_native_options(locator) -> Optional[List[Dict[str, str]]]:
+        """
+        Read every option of a native <select> as {'v': value, 't': text}, in DOM order
+        Returns None if the element is not a native select
+        """
+        try:
+            return await locator.evaluate("""
+                (el) => el.tagName === 'SELECT'
+                    ? Array.from(el.options).map(o => ({ v: o.value, t: o.text.trim() }))
+                    : null
+            """)
+        except Exception:
+            return None
+    
     @staticmethod
     async def _update_custom_select_input(page, original_input_locator, selected_label: str) -> None:
         """
@@ -337,40 +439,186 @@ class SelectFieldFiller:
                         }
                     }
                 """, await original_input_locator.element_handle(), selected_label)
-                print(f'   [CUSTOM_SELECT] Updated input text to: "{selected_label}"')
+                logger.debug('[CUSTOM_SELECT] Updated input text to: "%s"', selected_label)
+            except Exception as e:
+                logger.debug('[CUSTOM_SELECT] Error updating input text: %s', e)
+    
+    @staticmethod
+    async def _try_select_methods(locator, page, opt_value: str, option_index: int) -> Optional[str]:
+        """
+        Try to select a known option: select_option by value raced against DOM manipulation, then by index
+        Returns the name of the method that worked, or None if all failed
+        """
+        # Methods 1 and 2 race: select_option by value and DOM manipulation run concurrently,
+        # the first one whose result verifies wins and the other is cancelled
+        async def select_by_value():
+            logger.debug('[METHOD 1] Trying select_option(value="%s")', opt_value)
+            await locator.select_option(value=opt_value, timeout=2000)
+            return 'select_option'
+        
+        async def select_by_dom():
+            logger.debug('[METHOD 2] Trying DOM manipulation with value="%s"', opt_value)
+            result = await SelectFieldFiller._dom_set_select(page, locator, opt_value)
+            logger.debug('[METHOD 2] DOM result: %s', result)
+            return 'DOM'
+        
+        pending = {asyncio.create_task(select_by_value()), asyncio.create_task(select_by_dom())}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, timeout=2.0, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    logger.debug('[METHOD 1/2] Timed out waiting for select_option/DOM')
+                    break
+                for task in done:
+                    if task.exception() is not None:
+                        logger.debug('[METHOD 1/2] Failed: %s', task.exception())
+                        continue
+                    selected = await locator.input_value()
+                    logger.debug('[%s] Result: selected="%s", expected="%s"', task.result(), selected, opt_value)
+                    if selected == opt_value:
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Method 3: select_option by index
+        try:
+            logger.debug('[METHOD 3] Trying select_option(index=%s)', option_index)
+            await locator.select_option(index=option_index, timeout=5000)
+            await page.wait_for_timeout(300)
+            selected = await locator.input_value()
+            logger.debug('[METHOD 3] Result: selected="%s", expected="%s"', selected, opt_value)
+            if selected == opt_value:
+                return 'by index'
+        except Exception as e3:
+            logger.debug('[METHOD 3] Failed: %s', e3)
+        
+        return None
+    
+    @staticmethod
+    async def _select_first_existing_value(locator, values: List[str], timeout: int = 1500) -> Optional[str]:
+        """
+        Read the option values once and select the first candidate, in mapping order,
+        that exists as an option (exact match first, then case-insensitive)
+        Returns the selected value, or None
+        """
+        option_values = await locator.evaluate(
+            "(select) => Array.from(select.options || [], option => option.value)"
+        )
+        by_casefold = {}
+        for option_value in option_values:
+            by_casefold.setdefault(option_value.casefold(), option_value)
+        
+        for candidate in values:
+            option_value = candidate if candidate in option_values else by_casefold.get(candidate.casefold())
+            if option_value is None:
+                continue
+            await locator.select_option(value=option_value, timeout=timeout)
+            if await locator.input_value() == option_value:
+                return candidate
+            return None
+        return None
+    
+    @staticmethod
+    async def _select_first_candidate(locator, page, candidates: List[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """
+        Try candidate options in order inside the page and keep the first one that sticks
+        Falls back to Playwright's select_option per candidate only if the in-page attempt fails
+        Returns the winning candidate, or None
+        """
+        try:
+            winner = await locator.evaluate("""
+                (select, candidates) => {
+                    if (!select || !select.options) return null;
+                    const original = select.value;
+                    for (const c of candidates) {
+                        select.value = c.value;
+                        if (select.value === c.value) {
+                            select.dispatchEvent(new Event('change', { bubbles: true, cancelable: true }));
+                            select.dispatchEvent(new Event('input', { bubbles: true, cancelable: true }));
+                            return c;
+                        }
+                    }
+                    select.value = original;
+                    return null;
+                }
+            """, candidates)
+            if winner:
+                return winner
+        except Exception as e:
+            logger.debug('In-page candidate selection failed: %s', e)
+        
+        for candidate in candidates:
+            try:
+                logger.debug('Trying to select option with value="%s" (%s)', candidate['value'], candidate['reason'])
+                await locator.select_option(value=candidate['value'], timeout=5000)
+                if await locator.input_value() == candidate['value']:
+                    return candidate
             except Exception as e:
-                print(f'   [CUSTOM_SELECT] Error updating input text: {str(e)}')
+                logger.debug('Error selecting option: %s', e)
+        return None
+    
+    @staticmethod
+    async def _is_angular_page(page) -> bool:
+        """
+        Check whether the page uses AngularJS, cached on the page object per URL
+        """
+        cached = getattr(page, '_af_is_angular', None)
+        if cached and cached[0] == page.url:
+            return cached[1]
+        try:
+            is_angular = await page.evaluate("() => !!window.angular")
+        except Exception:
+            return False
+        page._af_is_angular = (page.url, is_angular)
+        return is_angular
+    
+    @staticmethod
+    async def _dom_set_select(page, locator, value: str) -> Dict[str, Any]:
+        """
+        Set the native <select> the locator resolved to straight in the DOM, in one evaluate
+        Returns {'ok': bool, 'value': current value or None}
+        """
+        script = _DOM_SET_JS_ANGULAR if await SelectFieldFiller._is_angular_page(page) else _DOM_SET_JS_SIMPLE
+        return await locator.evaluate(script, value)
     
     @staticmethod
     async def fill(page, selectors: List[str], value: str, field_name: str = '') -> bool:
         """
         Fill a select/dropdown field
         """
-        print(f'[INFO] Processing select field: "{field_name}" with value: "{value}"')
-        print(f'[INFO] Selectors to try: {selectors}')
+        logger.debug('[INFO] Processing select field: "%s" with value: "%s"', field_name, value)
+        logger.debug('[INFO] Selectors to try: %s', selectors)
+        
+        try:
+            await ensure_helpers(page)
+        except Exception as e:
+            logger.debug('Could not install page helpers: %s', e)
         
         # Variable to store original input locator for custom select
         original_input_locator = None
         
         for selector in selectors:
             try:
-                print(f'\n   [SELECTOR] Trying selector: {selector}')
+                logger.debug('[SELECTOR] Trying selector: %s', selector)
                 locator = page.locator(selector).first
                 
                 # Check if element exists
                 count = await locator.count()
-                print(f'   [SELECTOR] Element count: {count}')
+                logger.debug('[SELECTOR] Element count: %s', count)
                 
                 if count == 0:
-                    print(f'   [SELECTOR] No elements found with selector: {selector}')
+                    logger.debug('[SELECTOR] No elements found with selector: %s', selector)
                     continue
                 
                 # Wait for visibility
                 try:
                     await locator.wait_for(state='visible', timeout=5000)
-                    print(f'   [SELECTOR] Element is visible')
+                    logger.debug('[SELECTOR] Element is visible')
                 except Exception as e:
-                    print(f'   [SELECTOR] Element not visible or timeout: {str(e)}')
+                    logger.debug('[SELECTOR] Element not visible or timeout: %s', e)
                     # Try to continue anyway
                 
                 if await locator.count() > 0:
@@ -385,7 +633,7 @@ class SelectFieldFiller:
                     
                     # If it's an input text with data-placeholder, find the hidden select
                     if tag_name == 'input' and input_type == 'text' and data_placeholder:
-                        print(f'   [CUSTOM_SELECT] Detected custom select, finding hidden select element...')
+                        logger.debug('[CUSTOM_SELECT] Detected custom select, finding hidden select element...')
                         # Find hidden select in container
                         hidden_select = await page.evaluate("""
                             (input) => {
@@ -405,12 +653,12 @@ class SelectFieldFiller:
                         """, await locator.element_handle())
                         
                         if hidden_select:
-                            print(f'   [CUSTOM_SELECT] Found hidden select: id="{hidden_select.get("id")}", name="{hidden_select.get("name")}"')
+                            logger.debug('[CUSTOM_SELECT] Found hidden select: id="%s", name="%s"', hidden_select.get('id'), hidden_select.get('name'))
                             # Store the original input locator for later update
                             original_input_locator = locator
                             # Use the hidden select locator instead
                             locator = page.locator(hidden_select['selector']).first
-                            print(f'   [CUSTOM_SELECT] Using hidden select locator: {hidden_select["selector"]}')
+                            logger.debug('[CUSTOM_SELECT] Using hidden select locator: %s', hidden_select['selector'])
                         else:
                             original_input_locator = None
                     
@@ -418,51 +666,61 @@ class SelectFieldFiller:
                     available_options = []
                     try:
                         available_options = await SelectFieldFiller._get_available_options(locator)
+                        # Remember each option's position so matches don't need a list.index() scan
+                        for idx, opt in enumerate(available_options):
+                            opt['_index'] = idx
                         if available_options:
-                            print(f'   Found {len(available_options)} options in select')
+                            logger.debug('Found %s options in select', len(available_options))
                             # Log first few options for debugging
-                            for opt in available_options[:5]:
-                                print(f'      - value="{opt.get("value", "")}" label="{opt.get("label", "")}"')
+                            if logger.isEnabledFor(logging.DEBUG):
+                                for opt in available_options[:5]:
+                                    logger.debug('- value="%s" label="%s"', opt.get('value', ''), opt.get('label', ''))
                     except Exception as e:
-                        print(f'   Could not read options: {str(e)}')
+                        logger.debug('Could not read options: %s', e)
                     
                     # Get value mappings
                     mappings = SelectFieldFiller._get_value_mappings(field_name, value)
-                    print(f'   Mapped values: {", ".join(mappings["values"])}')
-                    if mappings["labels"]:
-                        print(f'   Mapped labels: {", ".join(mappings["labels"])}')
+                    # Normalized mapped values: in mapping order for the page, as a set for O(1) membership tests here
+                    values_ordered = tuple(dict.fromkeys(_normalize(str(v)) for v in mappings['values']))
+                    values_cf = frozenset(values_ordered)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug('Mapped values: %s', ', '.join(mappings['values']))
+                        if mappings["labels"]:
+                            logger.debug('Mapped labels: %s', ', '.join(mappings['labels']))
                     
                     # Strategy 0: Try to match with available options first (smart matching)
                     if available_options:
-                        value_lower = str(value).lower().strip()
+                        value_lower = _normalize(str(value))
                         value_str = str(value).strip()
-                        print(f'   [STRATEGY 0] Looking for value="{value_str}" (lowercase: "{value_lower}") in {len(available_options)} options')
+                        logger.debug('[STRATEGY 0] Looking for value="%s" (lowercase: "%s") in %s options', value_str, value_lower, len(available_options))
+                        
+                        # Normalize options and mappings once, reused by every match pass below
+                        options_norm = []
+                        for opt in available_options:
+                            opt_value = str(opt.get('value', '')).strip()
+                            opt_label = opt.get('label', '') or ''
+                            options_norm.append((opt, opt_value, opt_label, _normalize(opt_value), _normalize(opt_label)))
+                        mapped_labels_norm = [_normalize(m) for m in mappings['labels']]
                         
                         # First, try exact value match (most reliable)
                         # IMPORTANT: Skip placeholder options (empty value)
                         matching_option = None
-                        for opt in available_options:
-                            opt_value = str(opt.get('value', '')).strip()
-                            opt_label = opt.get('label', '')
-                            
+                        for opt, opt_value, opt_label, opt_value_lower, opt_label_lower in options_norm:
                             # Skip placeholder options (empty value)
                             if opt_value == '':
-                                print(f'   [STRATEGY 0] Skipping placeholder option: value="", label="{opt_label}"')
+                                logger.debug('[STRATEGY 0] Skipping placeholder option: value="", label="%s"', opt_label)
                                 continue
                             
-                            opt_value_lower = opt_value.lower().strip() if opt_value else ''
-                            opt_label_lower = opt_label.lower().strip() if opt_label else ''
-                            
                             # Exact value match (highest priority)
                             if opt_value == value_str or opt_value_lower == value_lower:
                                 matching_option = opt
-                                print(f'   [STRATEGY 0] Found EXACT value match: value="{opt_value}", label="{opt_label}"')
+                                logger.debug('[STRATEGY 0] Found EXACT value match: value="%s", label="%s"', opt_value, opt_label)
                                 break
                             
                             # Exact label match (second priority)
                             if opt_label == value_str or opt_label_lower == value_lower:
                                 matching_option = opt
-                                print(f'   [STRATEGY 0] Found EXACT label match: value="{opt_value}", label="{opt_label}"')
+                                logger.debug('[STRATEGY 0] Found EXACT label match: value="%s", label="%s"', opt_value, opt_label)
                                 break
                         
                         # If exact match found, try to select it immediately
@@ -471,9 +729,6 @@ class SelectFieldFiller:
                             opt_label = matching_option.get('label', '')
                             opt_index = matching_option.get('index')
                             
-                            # Try multiple methods to select
-                            success = False
-                            
                             # Check if this is a bw-select-menu (bw-popover custom select)
                             is_bw_select = False
                             if tag_name == 'button' and role == 'combobox':
@@ -486,33 +741,42 @@ class SelectFieldFiller:
                             # For bw-select-menu, handle specially
                             if is_bw_select:
                                 try:
-                                    print(f'   [BW_SELECT_METHOD] Trying bw-select-menu with value="{opt_value}", label="{opt_label}"...')
+                                    logger.debug('[BW_SELECT_METHOD] Trying bw-select-menu with value="%s", label="%s"...', opt_value, opt_label)
                                     
                                     # Step 1: Click on button to open popover
                                     await locator.click()
-                                    await page.wait_for_timeout(500)  # Wait for popover to open
                                     
-                                    # Step 2: Find and click the option in popover
-                                    option_clicked = await page.evaluate("""
-                                        (targetValue, targetLabel) => {
-                                            const popover = document.querySelector('bw-popover, bw-select-menu');
-                                            if (popover) {
-                                                const selectOptions = popover.querySelectorAll('bw-select-option');
-                                                for (const option of selectOptions) {
-                                                    const itemDiv = option.querySelector('div.item');
-                                                    const optionLabel = itemDiv ? itemDiv.textContent.trim() : '';
-                                                    
-                                                    // Match by label
-                                                    if (optionLabel === targetLabel || 
-                                                        optionLabel.toLowerCase() === targetLabel.toLowerCase()) {
-                                                        option.click();
-                                                        return true;
+                                    # Step 2: Click the option through Playwright's locator engine,
+                                    # which auto-waits for the popover to render
+                                    label_pattern = re.compile(rf'^\s*{re.escape(opt_label)}\s*$', re.IGNORECASE)
+                                    try:
+                                        await page.locator('bw-popover bw-select-option, bw-select-menu bw-select-option').filter(
+                                            has=page.locator('div.item', has_text=label_pattern)
+                                        ).first.click(timeout=1500)
+                                        option_clicked = True
+                                    except Exception as e_click:
+                                        logger.debug('[BW_SELECT_METHOD] Locator click failed, scanning popover: %s', e_click)
+                                        option_clicked = await page.evaluate("""
+                                            (targetLabel) => {
+                                                const targetLabelLower = targetLabel.toLowerCase();
+                                                const popover = document.querySelector('bw-popover, bw-select-menu');
+                                                if (popover) {
+                                                    const selectOptions = popover.querySelectorAll('bw-select-option');
+                                                    for (const option of selectOptions) {
+                                                        const itemDiv = option.querySelector('div.item');
+                                                        const optionLabel = itemDiv ? itemDiv.textContent.trim() : '';
+                                                        
+                                                        // Match by label
+                                                        if (optionLabel === targetLabel || 
+                                                            optionLabel.toLowerCase() === targetLabelLower) {
+                                                            option.click();
+                                                            return true;
+                                                        }
                                                     }
                                                 }
+                                                return false;
                                             }
-                                            return false;
-                                        }
-                                    """, opt_value, opt_label)
+                                        """, opt_label)
                                     
                                     if option_clicked:
                                         await page.wait_for_timeout(500)
@@ -523,7 +787,7 @@ class SelectFieldFiller:
                                         await page.keyboard.press('Escape')
                                         await page.wait_for_timeout(200)
                                 except Exception as e_bw:
-                                    print(f'   [BW_SELECT_METHOD] Failed: {str(e_bw)}')
+                                    logger.debug('[BW_SELECT_METHOD] Failed: %s', e_bw)
                                     # Try to close popover
                                     try:
                                         await page.keyboard.press('Escape')
@@ -534,471 +798,233 @@ class SelectFieldFiller:
                             # For custom select, try clicking on div.form__selectbox-option first
                             if original_input_locator and opt_label:
                                 try:
-                                    print(f'   [CUSTOM_SELECT_METHOD] Trying to click on div with label="{opt_label}"...')
+                                    logger.debug('[CUSTOM_SELECT_METHOD] Trying to click on div with label="%s"...', opt_label)
                                     # First, click on input to open dropdown
                                     await original_input_locator.click()
                                     await page.wait_for_timeout(300)
                                     
-                                    # Find and click the div with matching label
-                                    clicked = await page.evaluate("""
-                                        (input, label) => {
-                                            const container = input.closest('div');
-                                            if (container) {
-                                                const options = container.querySelectorAll('div.form__selectbox-option');
-                                                for (const option of options) {
-                                                    const optionLabel = option.textContent ? option.textContent.trim() : '';
-                                                    if (optionLabel === label || optionLabel.toLowerCase() === label.toLowerCase()) {
-                                                        option.click();
-                                                        return true;
-                                                    }
-                                                }
-                                            }
-                                            return false;
-                                        }
-                                    """, await original_input_locator.element_handle(), opt_label)
-                                    
-                                    if clicked:
-                                        await page.wait_for_timeout(500)
-                                        # Verify selection
-                                        select_value = await page.evaluate("""
-                                            (input) => {
+                                    # Resolve the input once and reuse it for both the click and the verification
+                                    input_handle = await original_input_locator.element_handle()
+                                    try:
+                                        # Find and click the div with matching label
+                                        clicked = await input_handle.evaluate("""
+                                            (input, label) => {
+                                                const labelLower = label.toLowerCase();
                                                 const container = input.closest('div');
                                                 if (container) {
-                                                    const select = container.querySelector('select.form--hidden, select[class*="hidden"], select[class*="cxsSelectField"]');
-                                                    if (select) {
-                                                        return select.value || '';
+                                                    const options = container.querySelectorAll('div.form__selectbox-option');
+                                                    for (const option of options) {
+                                                        const optionLabel = option.textContent ? option.textContent.trim() : '';
+                                                        if (optionLabel === label || optionLabel.toLowerCase() === labelLower) {
+                                                            option.click();
+                                                            return true;
+                                                        }
                                                     }
                                                 }
-                                                return '';
+                                                return false;
                                             }
-                                        """, await original_input_locator.element_handle())
+                                        """, opt_label)
                                         
+                                        select_value = None
+                                        if clicked:
+                                            await page.wait_for_timeout(500)
+                                            # Verify selection
+                                            select_value = await input_handle.evaluate("""
+                                                (input) => {
+                                                    const container = input.closest('div');
+                                                    if (container) {
+                                                        const select = container.querySelector('select.form--hidden, select[class*="hidden"], select[class*="cxsSelectField"]');
+                                                        if (select) {
+                                                            return select.value || '';
+                                                        }
+                                                    }
+                                                    return '';
+                                                }
+                                            """)
+                                    finally:
+                                        await input_handle.dispose()
+                                    
+                                    if clicked:
                                         if select_value == opt_value or (select_value and str(select_value) == opt_value):
                                             print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (custom select - clicked div)')
                                             await SelectFieldFiller._update_custom_select_input(page, original_input_locator, opt_label)
                                             return True
                                         else:
-                                            print(f'   [CUSTOM_SELECT_METHOD] Click succeeded but value mismatch: got="{select_value}", expected="{opt_value}"')
+                                            logger.debug('[CUSTOM_SELECT_METHOD] Click succeeded but value mismatch: got="%s", expected="%s"', select_value, opt_value)
                                 except Exception as e_custom:
-                                    print(f'   [CUSTOM_SELECT_METHOD] Failed: {str(e_custom)}')
-                            
-                            # Method 1: select_option by value (for hidden select)
-                            try:
-                                print(f'   [METHOD 1] Trying select_option(value="{opt_value}")')
-                                await locator.select_option(value=opt_value, timeout=5000)
-                                await page.wait_for_timeout(300)
-                                selected = await locator.input_value()
-                                print(f'   [METHOD 1] Result: selected="{selected}", expected="{opt_value}"')
-                                if selected == opt_value or (selected and str(selected) == opt_value):
-                                    print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (exact match - select_option)')
-                                    # Update custom select input if needed
-                                    if original_input_locator:
-                                        await SelectFieldFiller._update_custom_select_input(page, original_input_locator, opt_label)
-                                    return True
-                                else:
-                                    print(f'   [METHOD 1] Verification failed')
-                            except Exception as e1:
-                                print(f'   [METHOD 1] Failed: {str(e1)}')
-                            
-                            # Method 2: DOM manipulation
-                            if not success:
-                                try:
-                                    print(f'   [METHOD 2] Trying DOM manipulation with value="{opt_value}"')
-                                    result = await page.evaluate("""
-                                        (sel, optVal) => {
-                                            const select = document.querySelector(sel);
-                                            if (select) {
-                                                console.log('DOM: Setting select.value to', optVal, 'type:', typeof optVal);
-                                                // Try as string first
-                                                select.value = String(optVal);
-                                                console.log('DOM: select.value is now', select.value, 'type:', typeof select.value);
-                                                
-                                                // Trigger standard events
-                                                const changeEvent = new Event('change', { bubbles: true, cancelable: true });
-                                                select.dispatchEvent(changeEvent);
-                                                const inputEvent = new Event('input', { bubbles: true, cancelable: true });
-                                                select.dispatchEvent(inputEvent);
-                                                
-                                                // Angular support
-                                                if (window.angular) {
-                                                    try {
-                                                        const elem = window.angular.element(select);
-                                                        if (elem && elem.injector) {
-                                                            const $rootScope = elem.injector().get('$rootScope');
-                                                            if ($rootScope) {
-                                                                $rootScope.$apply();
-                                                            }
-                                                        }
-                                                    } catch (e) {
-                                                        console.log('Angular digest failed:', e);
-                                                    }
-                                                }
-                                                
-                                                return select.value;
-                                            }
-                                            return null;
-                                        }
-                                    """, selector, opt_value)
-                                    print(f'   [METHOD 2] DOM result: {result}')
-                                    await page.wait_for_timeout(500)
-                                    selected = await locator.input_value()
-                                    print(f'   [METHOD 2] After DOM: selected="{selected}", expected="{opt_value}"')
-                                    if selected == opt_value or (selected and str(selected) == str(opt_value)):
-                                        print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (exact match - DOM)')
-                                        # Update custom select input if needed
-                                        if original_input_locator:
-                                            await SelectFieldFiller._update_custom_select_input(page, original_input_locator, opt_label)
-                                        return True
-                                    else:
-                                        print(f'   [METHOD 2] Verification failed')
-                                except Exception as e2:
-                                    print(f'   [METHOD 2] Failed: {str(e2)}')
+                                    logger.debug('[CUSTOM_SELECT_METHOD] Failed: %s', e_custom)
                             
-                            # Method 3: select_option by index
-                            if not success:
-                                try:
-                                    option_index = available_options.index(matching_option)
-                                    print(f'   [METHOD 3] Trying select_option(index={option_index})')
-                                    await locator.select_option(index=option_index, timeout=5000)
-                                    await page.wait_for_timeout(300)
-                                    selected = await locator.input_value()
-                                    print(f'   [METHOD 3] Result: selected="{selected}", expected="{opt_value}"')
-                                    if selected == opt_value or (selected and str(selected) == str(opt_value)):
-                                        print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (exact match - by index)')
-                                        # Update custom select input if needed
-                                        if original_input_locator:
-                                            await SelectFieldFiller._update_custom_select_input(page, original_input_locator, opt_label)
-                                        return True
-                                    else:
-                                        print(f'   [METHOD 3] Verification failed')
-                                except Exception as e3:
-                                    print(f'   [METHOD 3] Failed: {str(e3)}')
+                            option_index = matching_option['_index']
+                            method = await SelectFieldFiller._try_select_methods(locator, page, opt_value, option_index)
+                            if method:
+                                print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (exact match - {method})')
+                                # Update custom select input if needed
+                                if original_input_locator:
+                                    await SelectFieldFiller._update_custom_select_input(page, original_input_locator, opt_label)
+                                return True
                         
-                        # If no exact match, try mapped values and labels (skip placeholders)
-                        for opt in available_options:
-                            opt_value = str(opt.get('value', '')).strip()
-                            opt_label = opt.get('label', '')
-                            
+                        # If no exact match, collect every option matching a mapped value/label, the
+                        # original value or a partial label match (skip placeholders), in priority order
+                        # Resolve partial label matches for all options at once
+                        labels_lower = [norm[4] for norm in options_norm]
+                        joined_labels = '\x00'.join(labels_lower)
+                        label_offsets = []
+                        offset = 0
+                        for label_lower in labels_lower:
+                            label_offsets.append(offset)
+                            offset += len(label_lower) + 1
+                        mapped_label_hits = set()
+                        for mapped_lower in mapped_labels_norm:
+                            mapped_label_hits |= _partial_label_matches(mapped_lower, joined_labels, label_offsets, labels_lower)
+                        partial_hits = _partial_label_matches(value_lower, joined_labels, label_offsets, labels_lower)
+                        
+                        candidates = []
+                        for idx, (opt, opt_value, opt_label, opt_value_lower, opt_label_lower) in enumerate(options_norm):
                             # Skip placeholder options (empty value)
                             if opt_value == '':
                                 continue
                             
-                            opt_value_lower = opt_value.lower().strip() if opt_value else ''
-                            opt_label_lower = opt_label.lower().strip() if opt_label else ''
-                            
-                            # Check mapped values
-                            for mapped_value in mappings['values']:
-                                mapped_lower = mapped_value.lower().strip()
-                                if opt_value_lower == mapped_lower or opt_label_lower == mapped_lower:
-                                    try:
-                                        print(f'   Trying to select option with value="{opt_value}" (mapped from "{mapped_value}")')
-                                        await locator.select_option(value=opt_value, timeout=5000)
-                                        await page.wait_for_timeout(200)
-                                        selected = await locator.input_value()
-                                        if selected == opt_value or (selected and opt_value and str(selected) == opt_value):
-                                            print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (smart match)')
-                                            # Update custom select input if needed
-                                            if original_input_locator:
-                                                await SelectFieldFiller._update_custom_select_input(page, original_input_locator, opt_label)
-                                            return True
-                                    except Exception as e:
-                                        print(f'   Error selecting option: {str(e)}')
-                                        pass
-                            
-                            # Check mapped labels
-                            for mapped_label in mappings['labels']:
-                                mapped_lower = mapped_label.lower().strip()
-                                if mapped_lower in opt_label_lower or opt_label_lower in mapped_lower:
-                                    try:
-                                        print(f'   Trying to select option with value="{opt_value}" (label match: "{mapped_label}")')
-                                        await locator.select_option(value=opt_value, timeout=5000)
-                                        await page.wait_for_timeout(200)
-                                        selected = await locator.input_value()
-                                        if selected == opt_value or (selected and opt_value and str(selected) == opt_value):
-                                            print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (smart label match)')
-                                            # Update custom select input if needed
-                                            if original_input_locator:
-                                                await SelectFieldFiller._update_custom_select_input(page, original_input_locator, opt_label)
-                                            return True
-                                    except Exception as e:
-                                        print(f'   Error selecting option: {str(e)}')
-                                        pass
-                            
-                            # Check original value directly (exact match first)
-                            if value_lower == opt_value_lower or value_lower == opt_label_lower:
-                                try:
-                                    print(f'   [EXACT MATCH] Found option: value="{opt_value}", label="{opt_label}"')
-                                    print(f'   [EXACT MATCH] Trying to select with value="{opt_value}" (input value="{value}")')
-                                    
-                                    # Method 1: Try select_option first
-                                    try:
-                                        print(f'   [METHOD 1] Trying select_option(value="{opt_value}")')
-                                        await locator.select_option(value=opt_value, timeout=5000)
-                                        await page.wait_for_timeout(300)
-                                        selected = await locator.input_value()
-                                        print(f'   [METHOD 1] After select_option: selected="{selected}", expected="{opt_value}"')
-                                        if selected == opt_value or (selected and opt_value and str(selected) == str(opt_value)):
-                                            print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (exact match - select_option)')
-                                            return True
-                                        else:
-                                            print(f'   [METHOD 1] Verification failed: selected="{selected}" (type: {type(selected)}), expected="{opt_value}" (type: {type(opt_value)})')
-                                    except Exception as e1:
-                                        print(f'   [METHOD 1] select_option failed: {str(e1)}')
-                                        
-                                        # Method 2: Try by index
-                                        try:
-                                            option_index = available_options.index(opt)
-                                            print(f'   [METHOD 2] Trying select_option(index={option_index})')
-                                            await locator.select_option(index=option_index, timeout=5000)
-                                            await page.wait_for_timeout(300)
-                                            selected = await locator.input_value()
-                                            print(f'   [METHOD 2] After select_option by index: selected="{selected}", expected="{opt_value}"')
-                                            if selected == opt_value or (selected and opt_value and str(selected) == str(opt_value)):
-                                                print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (exact match - by index)')
-                                                return True
-                                            else:
-                                                print(f'   [METHOD 2] Verification failed: selected="{selected}", expected="{opt_value}"')
-                                        except Exception as e2:
-                                            print(f'   [METHOD 2] select_option by index failed: {str(e2)}')
-                                            
-                                            # Method 3: Try DOM manipulation (including Angular support)
-                                            try:
-                                                print(f'   [METHOD 3] Trying DOM manipulation with value="{opt_value}"')
-                                                result = await page.evaluate("""
-                                                    (sel, optVal) => {
-                                                        const select = document.querySelector(sel);
-                                                        if (select) {
-                                                            console.log('DOM: Setting select.value to', optVal);
-                                                            select.value = optVal;
-                                                            console.log('DOM: select.value is now', select.value);
-                                                            
-                                                            // Trigger standard events
-                                                            const changeEvent = new Event('change', { bubbles: true, cancelable: true });
-                                                            select.dispatchEvent(changeEvent);
-                                                            const inputEvent = new Event('input', { bubbles: true, cancelable: true });
-                                                            select.dispatchEvent(inputEvent);
-                                                            
-                                                            // Angular support: trigger ngModel change
-                                                            if (window.angular && select.attributes['ng-model']) {
-                                                                try {
-                                                                    const scope = window.angular.element(select).scope();
-                                                                    if (scope) {
-                                                                        scope.$apply(function() {
-                                                                            scope[select.attributes['ng-model'].value] = optVal;
-                                                                        });
-                                                                    }
-                                                                } catch (e) {
-                                                                    console.log('Angular scope update failed:', e);
-                                                                }
-                                                            }
-                                                            
-                                                            // Try to trigger Angular digest if available
-                                                            if (window.angular) {
-                                                                try {
-                                                                    const elem = window.angular.element(select);
-                                                                    if (elem && elem.injector) {
-                                                                        const $rootScope = elem.injector().get('$rootScope');
-                                                                        if ($rootScope) {
-                                                                            $rootScope.$apply();
-                                                                        }
-                                                                    }
-                                                                } catch (e) {
-                                                                    console.log('Angular digest failed:', e);
-                                                                }
-                                                            }
-                                                            
-                                                            return select.value;
-                                                        }
-                                                        return null;
-                                                    }
-                                                """, {'sel': selector, 'optVal': opt_value})
-                                                print(f'   [METHOD 3] DOM manipulation result: {result}')
-                                                await page.wait_for_timeout(500)  # Give Angular time to process
-                                                selected = await locator.input_value()
-                                                print(f'   [METHOD 3] After DOM manipulation: selected="{selected}", expected="{opt_value}"')
-                                                if selected == opt_value or (selected and opt_value and str(selected) == str(opt_value)):
-                                                    print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (exact match - DOM)')
-                                                    return True
-                                                else:
-                                                    print(f'   [METHOD 3] Verification failed: selected="{selected}", expected="{opt_value}"')
-                                            except Exception as e3:
-                                                print(f'   [METHOD 3] DOM manipulation failed: {str(e3)}')
-                                    
-                                    # If all methods failed, log current state
-                                    current_value = await locator.input_value()
-                                    print(f'   [FINAL STATE] Current select value: "{current_value}"')
-                                    print(f'   [FINAL STATE] Expected value: "{opt_value}"')
-                                    
-                                except Exception as e:
-                                    print(f'   [ERROR] Error in exact match logic: {str(e)}')
-                                    import traceback
-                                    print(f'   [ERROR] Traceback: {traceback.format_exc()}')
-                                    pass
-                            
-                            # Check partial match (skip placeholders)
-                            if opt_value != '' and (value_lower in opt_label_lower or opt_label_lower in value_lower):
-                                try:
-                                    print(f'   Trying to select option with value="{opt_value}" (partial match: "{value}" in "{opt_label}")')
-                                    await locator.select_option(value=opt_value, timeout=5000)
-                                    await page.wait_for_timeout(300)
-                                    selected = await locator.input_value()
-                                    if selected == opt_value or (selected and opt_value and str(selected) == str(opt_value)):
-                                        print(f'[OK] {field_name or selector}: \'{value}\' -> \'{opt_value}\' (partial match)')
-                                        return True
-                                except Exception as e:
-                                    print(f'   Error selecting option: {str(e)}')
-                                    pass
+                            if opt_value_lower in values_cf or opt_label_lower in values_cf:
+                                reason = 'smart match'
+                            elif idx in mapped_label_hits:
+                                reason = 'smart label match'
+                            elif value_lower == opt_value_lower or value_lower == opt_label_lower:
+                                reason = 'exact match'
+                            elif idx in partial_hits:
+                                reason = 'partial match'
+                            else:
+                                continue
+                            candidates.append({'value': opt_value, 'label': opt_label, 'reason': reason})
+                        
+                        if candidates:
+                            winner = await SelectFieldFiller._select_first_candidate(locator, page, candidates)
+                            if winner:
+                                print(f'[OK] {field_name or selector}: \'{value}\' -> \'{winner["value"]}\' ({winner["reason"]})')
+                                # Update custom select input if needed
+                                if original_input_locator:
+                                    await SelectFieldFiller._update_custom_select_input(page, original_input_locator, winner['label'])
+                                return True
                     
-                    # Strategy 1: Try direct DOM manipulation with mapped values FIRST
-                    for mapped_value in mappings['values']:
-                        print(f'   Trying DOM manipulation with value: "{mapped_value}"')
-                        try:
-                            success = await page.evaluate("""
-                                ({ sel, optionValue }) => {
-                                    const select = document.querySelector(sel);
-                                    if (select) {
-                                        // Find option with this value
-                                        for (let i = 0; i < select.options.length; i++) {
-                                            if (select.options[i].value === optionValue || 
-                                                select.options[i].value.toLowerCase() === optionValue.toLowerCase()) {
-                                                select.value = select.options[i].value;
-                                                
-                                                // Trigger events
-                                                const changeEvent = new Event('change', { bubbles: true, cancelable: true });
-                                                select.dispatchEvent(changeEvent);
-                                                
-                                                const inputEvent = new Event('input', { bubbles: true, cancelable: true });
-                                                select.dispatchEvent(inputEvent);
-                                                
-                                                return select.value === select.options[i].value;
-                                            }
-                                        }
-                                    }
-                                    return false;
-                                }
-                            """, {'sel': selector, 'optionValue': mapped_value})
-                            
-                            if success:
-                                await page.wait_for_timeout(200)
-                                # Verify
+                    # Native <select>: decide from the option list directly instead of trial and error
+                    native_options = await SelectFieldFiller._read_native_options(locator)
+                    if native_options is not None:
+                        by_value = {}
+                        by_text = {}
+                        for idx, opt in enumerate(native_options):
+                            if opt['v'] == '':
+                                continue
+                            by_value.setdefault(_normalize(opt['v']), idx)
+                            by_text.setdefault(_normalize(opt['t']), idx)
+                        
+                        target_index = None
+                        for key in [str(value), *mappings['values'], *mappings['labels']]:
+                            key_norm = _normalize(str(key))
+                            target_index = by_value.get(key_norm, by_text.get(key_norm))
+                            if target_index is not None:
+                                break
+                        
+                        # An exact miss (or a value that doesn't stick) falls through to the
+                        # strategy ladder below, which also tries partial and DOM-level matches
+                        if target_index is None:
+                            logger.debug('No exact option matches "%s" in native select %s', value, selector)
+                        else:
+                            target_value = native_options[target_index]['v']
+                            try:
+                                await locator.select_option(index=target_index, timeout=5000)
                                 selected = await locator.input_value()
-                                if selected == mapped_value or selected.lower() == mapped_value.lower():
-                                    print(f'[OK] {field_name or selector}: \'{value}\' -> \'{mapped_value}\' (direct DOM)')
-                                    return True
-                        except Exception as e:
-                            print(f'   DOM manipulation error: {str(e)}')
-                            pass
-                    
-                    # Strategy 2: Try select_option with mapped values
-                    for mapped_value in mappings['values']:
-                        try:
-                            await locator.select_option(value=mapped_value, timeout=5000)
-                            selected_value = await locator.input_value()
-                            if selected_value == mapped_value or selected_value.lower() == mapped_value.lower():
-                                print(f'[OK] {field_name or selector}: \'{value}\' -> \'{mapped_value}\' (selectOption)')
+                            except Exception as e:
+                                logger.debug('select_option(index=%s) failed, setting selectedIndex: %s', target_index, e)
+                                selected = await locator.evaluate("""
+                                    (select, index) => {
+                                        select.selectedIndex = index;
+                                        select.dispatchEvent(new Event('change', { bubbles: true, cancelable: true }));
+                                        select.dispatchEvent(new Event('input', { bubbles: true, cancelable: true }));
+                                        return select.value;
+                                    }
+                                """, target_index)
+                            if selected == target_value:
+                                print(f'[OK] {field_name or selector}: \'{value}\' -> \'{target_value}\' (option lookup)')
+                                if original_input_locator:
+                                    await SelectFieldFiller._update_custom_select_input(page, original_input_locator, native_options[target_index]['t'])
                                 return True
-                        except Exception:
-                            # Continue to next value
-                            pass
+                    
+                    value_str = str(value).strip()
+                    
+                    # Strategy 1: Try direct DOM manipulation with mapped values FIRST
+                    async def dom_mapped():
+                        logger.debug('Trying DOM manipulation with values: %s', mappings['values'])
+                        result = await locator.evaluate(
+                            "(select, values) => window.__autoFormFill.selectByValues(select, values)",
+                            list(values_ordered)
+                        )
+                        if result['ok'] and _normalize(result['value']) in values_cf:
+                            return True, f"-> '{result['value']}', direct DOM"
+                        return False, None
+                    
+                    # Strategy 2: Try select_option with the first mapped value the select offers
+                    async def select_mapped_value():
+                        mapped_value = await SelectFieldFiller._select_first_existing_value(locator, mappings['values'])
+                        return mapped_value is not None, f"-> '{mapped_value}', selectOption"
                     
                     # Strategy 3: Try by label
-                    for mapped_label in mappings['labels']:
-                        try:
-                            await locator.select_option(label=mapped_label, timeout=5000)
-                            selected_value = await locator.input_value()
-                            if selected_value:
-                                print(f'[OK] {field_name or selector}: \'{value}\' -> \'{mapped_label}\' (by label)')
-                                return True
-                        except Exception:
-                            # Continue
-                            pass
+                    async def select_mapped_label():
+                        for mapped_label in mappings['labels']:
+                            try:
+                                await locator.select_option(label=mapped_label, timeout=5000)
+                            except Exception:
+                                continue
+                            if await locator.input_value():
+                                return True, f"-> '{mapped_label}', by label"
+                        return False, None
                     
                     # Strategy 4: Try original value directly with multiple methods
-                    value_str = str(value).strip()
-                    try:
-                        # Method 1: Try select_option with value
-                        try:
-                            await locator.select_option(value=value_str, timeout=5000)
-                            await page.wait_for_timeout(300)
-                            selected_value = await locator.input_value()
-                            if selected_value == value_str or (selected_value and str(selected_value) == value_str):
-                                print(f'[OK] {field_name or selector}: \'{value}\' (select_option by value)')
-                                return True
-                        except Exception as e1:
-                            print(f'   select_option by value failed: {str(e1)}')
-                            
-                            # Method 2: Try by index if value is a number
-                            try:
-                                if value_str.isdigit():
-                                    index = int(value_str)
-                                    # Find option index in available_options
-                                    for idx, opt in enumerate(available_options):
-                                        if opt.get('value') == value_str:
-                                            await locator.select_option(index=idx, timeout=5000)
-                                            await page.wait_for_timeout(300)
-                                            selected_value = await locator.input_value()
-                                            if selected_value == value_str or (selected_value and str(selected_value) == value_str):
-                                                print(f'[OK] {field_name or selector}: \'{value}\' (select_option by index)')
-                                                return True
-                            except Exception as e2:
-                                print(f'   select_option by index failed: {str(e2)}')
-                            
-                            # Method 3: Try DOM manipulation
-                            try:
-                                success = await page.evaluate("""
-                                    ({ sel, optionValue }) => {
-                                        const select = document.querySelector(sel);
-                                        if (select) {
-                                            // Find option with this value (exact match first)
-                                            for (let i = 0; i < select.options.length; i++) {
-                                                if (select.options[i].value === optionValue || String(select.options[i].value) === String(optionValue)) {
-                                                    select.value = select.options[i].value;
-                                                    const changeEvent = new Event('change', { bubbles: true, cancelable: true });
-                                                    select.dispatchEvent(changeEvent);
-                                                    const inputEvent = new Event('input', { bubbles: true, cancelable: true });
-                                                    select.dispatchEvent(inputEvent);
-                                                    return select.value === select.options[i].value || String(select.value) === String(optionValue);
-                                                }
-                                            }
-                                            // Try case-insensitive match
-                                            const optionValueLower = String(optionValue).toLowerCase();
-                                            for (let i = 0; i < select.options.length; i++) {
-                                                if (String(select.options[i].value).toLowerCase() === optionValueLower) {
-                                                    select.value = select.options[i].value;
-                                                    const changeEvent = new Event('change', { bubbles: true, cancelable: true });
-                                                    select.dispatchEvent(changeEvent);
-                                                    const inputEvent = new Event('input', { bubbles: true, cancelable: true });
-                                                    select.dispatchEvent(inputEvent);
-                                                    return true;
-                                                }
-                                            }
-                                        }
-                                        return false;
-                                    }
-                                """, {'sel': selector, 'optionValue': value_str})
-                                
-                                if success:
-                                    await page.wait_for_timeout(300)
-                                    selected_value = await locator.input_value()
-                                    if selected_value == value_str or (selected_value and str(selected_value) == value_str):
-                                        print(f'[OK] {field_name or selector}: \'{value}\' (DOM manipulation)')
-                                        return True
-                            except Exception as e3:
-                                print(f'   DOM manipulation failed: {str(e3)}')
-                            
-                            # Method 4: Try by label
-                            try:
-                                await locator.select_option(label=value_str, timeout=5000)
+                    async def value_by_select_option():
+                        await locator.select_option(value=value_str, timeout=5000)
+                        await page.wait_for_timeout(300)
+                        return await locator.input_value() == value_str, 'select_option by value'
+                    
+                    async def value_by_index():
+                        # Find option index in available_options
+                        for idx, opt in enumerate(available_options):
+                            if opt.get('value') == value_str:
+                                await locator.select_option(index=idx, timeout=5000)
                                 await page.wait_for_timeout(300)
-                                selected_value = await locator.input_value()
-                                if selected_value:
-                                    print(f'[OK] {field_name or selector}: \'{value}\' (by label)')
-                                    return True
-                            except Exception as e4:
-                                print(f'   select_option by label failed: {str(e4)}')
-                    except Exception as e:
-                        print(f'   All methods failed: {str(e)}')
-                        pass
+                                return await locator.input_value() == value_str, 'select_option by index'
+                        return False, None
+                    
+                    async def value_by_dom():
+                        result = await locator.evaluate(
+                            "(select, optionValue) => window.__autoFormFill.selectByValue(select, optionValue)",
+                            value_str
+                        )
+                        return result['ok'] and result['value'] == value_str, 'DOM manipulation'
+                    
+                    async def value_by_label():
+                        await locator.select_option(label=value_str, timeout=5000)
+                        await page.wait_for_timeout(300)
+                        return bool(await locator.input_value()), 'by label'
+                    
+                    # Strategies whose prerequisites are not met are left out instead of failing inside a try
+                    strategies = []
+                    if mappings['values']:
+                        strategies += [('dom_mapped', dom_mapped), ('select_mapped_value', select_mapped_value)]
+                    if mappings['labels']:
+                        strategies.append(('select_mapped_label', select_mapped_label))
+                    if value_str:
+                        strategies.append(('value_by_select_option', value_by_select_option))
+                        if value_str.isdigit():
+                            strategies.append(('value_by_index', value_by_index))
+                        strategies += [('value_by_dom', value_by_dom), ('value_by_label', value_by_label)]
+                    
+                    for name, strategy in strategies:
+                        try:
+                            ok, how = await strategy()
+                        except Exception as e:
+                            logger.debug('%s failed: %s', name, e)
+                            continue
+                        if ok:
+                            print(f'[OK] {field_name or selector}: \'{value}\' ({how})')
+                            return True
             except Exception:
                 continue
         
@@ -3,7 +3,74 @@ Text Field Filler Module
 Handles text, email, tel, password, and number inputs
 """
 
-from typing import List
+import asyncio
+import logging
+import re
+import weakref
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SEARCH_TERM_SPLIT_RE = re.compile(r'[\s\-_()]+')
+
+# Field-name fragments (lowercase) mapped to the autocomplete token of the matching input
+_AUTOCOMPLETE_MAP = {
+    'first name': 'given-name',
+    'vorname': 'given-name',
+    'last name': 'family-name',
+    'nachname': 'family-name',
+    'email': 'email',
+    'e-mail': 'email',
+    'phone': 'tel',
+    'telefon': 'tel'
+}
+# All map keys as one alternation, so the field name is scanned once
+_AUTOCOMPLETE_RE = re.compile('|'.join(re.escape(key) for key in _AUTOCOMPLETE_MAP))
+
+# Resolve with the field value as soon as it is non-empty, waiting at most 200ms for an input event
+_SETTLED_VALUE_JS = """
+    (el) => new Promise(resolve => {
+        if (el.value !== '') {
+            resolve(el.value);
+            return;
+        }
+        el.addEventListener('input', () => resolve(el.value), { once: true });
+        setTimeout(() => resolve(el.value), 200);
+    })
+"""
+
+# One-pass snapshot of everything smart_fill searches: every <label> with the selector of the
+# field it labels (via aria-labelledby or for, only if that field exists) and every
+# aria-labelled input/textarea with a selector built from its id, name and aria-label, so the
+# winner is still found after the form re-renders
+_LABEL_SNAPSHOT_JS = """
+    () => ({
+        labels: Array.from(document.querySelectorAll('label')).map(l => {
+            const forId = l.getAttribute('for');
+            const labelledby = l.id ? `[aria-labelledby="${CSS.escape(l.id)}"]` : null;
+            return {
+                text: (l.textContent || '').toLowerCase(),
+                labelledby_target: labelledby && document.querySelector(labelledby) ? labelledby : null,
+                for_target: forId && document.getElementById(forId) ? '#' + CSS.escape(forId) : null
+            };
+        }),
+        aria: Array.from(document.querySelectorAll(
+            'input[aria-label], textarea[aria-label]'
+        )).map(el => {
+            const tag = el.tagName.toLowerCase();
+            const label = el.getAttribute('aria-label');
+            const name = el.getAttribute('name');
+            let selector = `${tag}[aria-label="${CSS.escape(label)}"]`;
+            if (el.id) {
+                selector = '#' + CSS.escape(el.id);
+            } else if (name) {
+                selector = `${tag}[name="${CSS.escape(name)}"][aria-label="${CSS.escape(label)}"]`;
+            }
+            return { label: label.toLowerCase(), tag, selector };
+        })
+    })
+"""
 
 
 class TextFieldFiller:
@@ -11,51 +78,124 @@ class TextFieldFiller:
     Handles text input fields
     """
     
+    # Label snapshot per page, dropped when the main frame navigates
+    _labels_cache = weakref.WeakKeyDictionary()
+    
+    @staticmethod
+    async def _get_label_snapshot(page, refresh: bool = False) -> Dict[str, list]:
+        """
+        Return the cached label/aria-label snapshot of the page, taking it on first use
+        refresh retakes it, e.g. after the form re-rendered
+        """
+        cache = TextFieldFiller._labels_cache
+        if page not in cache:
+            def invalidate(frame):
+                if frame == page.main_frame:
+                    cache[page] = None
+            page.on('framenavigated', invalidate)
+            cache[page] = None
+        
+        snapshot = cache[page]
+        # An empty snapshot may have been taken before the form rendered, so it is retaken
+        if refresh or not snapshot or not (snapshot['labels'] or snapshot['aria']):
+            snapshot = await page.evaluate(_LABEL_SNAPSHOT_JS)
+            cache[page] = snapshot
+        return snapshot
+    
+    @staticmethod
+    async def _scroll_into_view(page, locator) -> None:
+        """
+        Scroll the element into view unless its box already lies inside the viewport
+        """
+        viewport = page.viewport_size
+        if viewport:
+            box = await locator.bounding_box()
+            if (box and 0 <= box['y'] <= viewport['height'] - box['height']
+                    and 0 <= box['x'] <= viewport['width'] - box['width']):
+                return
+        await locator.scroll_into_view_if_needed()
+    
+    @staticmethod
+    async def _fill_locator(page, locator, value: str, label: str) -> bool:
+        """
+        Fill a located text field and verify the value, typing it if fill() didn't stick
+        """
+        # Nothing to do if the field already holds the value (autofill, refill after an error)
+        if await locator.input_value() == value:
+            print(f'✅ {label}: \'{value}\' (already set)')
+            return True
+        
+        await TextFieldFiller._scroll_into_view(page, locator)
+        await locator.focus()
+        await locator.fill(value)
+        
+        # Verify once the field has a value (or after a short input-event grace period)
+        current_value = await locator.evaluate(_SETTLED_VALUE_JS)
+        if current_value == value or value in current_value:
+            print(f'✅ {label}: \'{value}\'')
+            return True
+        
+        # Try typing if fill didn't work
+        await locator.clear()
+        await locator.type(value, delay=30)
+        typed_value = await locator.input_value()
+        if typed_value == value or value in typed_value:
+            print(f'✅ {label}: \'{value}\' (typed)')
+            return True
+        return False
+    
+    @staticmethod
+    async def _visible_in_order(page, selectors: List[str], timeout: int = 2000) -> list:
+        """
+        Return (selector, locator) for every selector whose first match is visible, in
+        selector order; checks without waiting first, then waits once for whichever
+        selector turns visible first instead of once per selector
+        """
+        locators = [(selector, page.locator(selector).first) for selector in selectors]
+        
+        async def visible_now():
+            flags = await asyncio.gather(*(loc.is_visible() for _, loc in locators), return_exceptions=True)
+            return [entry for entry, flag in zip(locators, flags) if flag is True]
+        
+        found = await visible_now()
+        if found:
+            return found
+        
+        tasks = [asyncio.ensure_future(loc.wait_for(state='visible', timeout=timeout)) for _, loc in locators]
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.exception() is None for task in done):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return await visible_now()
+    
     @staticmethod
     async def fill(page, selectors: List[str], value: str, field_name: str = '') -> bool:
         """
         Fill a text input field
+        The first visible selector in list order wins, and a missing selector doesn't
+        cost its own visibility timeout
         """
-        for selector in selectors:
+        for selector, locator in await TextFieldFiller._visible_in_order(page, selectors):
             try:
-                locator = page.locator(selector).first
-                await locator.wait_for(state='visible', timeout=2000)
-                
-                if await locator.count() > 0:
-                    await locator.scroll_into_view_if_needed()
-                    await page.wait_for_timeout(50)
-                    
-                    await locator.focus()
-                    await page.wait_for_timeout(50)
-                    
-                    await locator.clear()
-                    await page.wait_for_timeout(50)
-                    
-                    await locator.fill(value)
-                    await page.wait_for_timeout(50)
-                    
-                    # Verify
-                    current_value = await locator.input_value()
-                    if current_value == value or value in current_value:
-                        print(f'✅ {field_name or selector}: \'{value}\'')
-                        return True
-                    else:
-                        # Try typing if fill didn't work
-                        await locator.clear()
-                        await locator.type(value, delay=30)
-                        typed_value = await locator.input_value()
-                        if typed_value == value or value in typed_value:
-                            print(f'✅ {field_name or selector}: \'{value}\' (typed)')
-                            return True
+                if await TextFieldFiller._fill_locator(page, locator, value, field_name or selector):
+                    return True
             except Exception:
                 continue
         
         return False
     
     @staticmethod
-    def _get_search_terms(field_name: str) -> List[str]:
+    @lru_cache(maxsize=256)
+    def _get_search_terms(field_name: str) -> Tuple[str, ...]:
         """
-        Get search terms from field name
+        Get search terms from field name (cached, so returns an immutable tuple)
         """
         terms = []
         lower_name = field_name.lower()
@@ -69,11 +209,42 @@ class TextFieldFiller:
         if 'phone' in lower_name or 'telefon' in lower_name:
             terms.extend(['phone', 'telefon', 'tel', 'mobile'])
         
-        import re
-        words = [w for w in re.split(r'[\s\-_()]+', field_name) if len(w) > 2]
+        words = [w for w in _SEARCH_TERM_SPLIT_RE.split(field_name) if len(w) > 2]
         terms.extend([w.lower() for w in words])
         
-        return list(set(terms))
+        # Ordered dedup: the explicit synonyms above stay ahead of the raw words
+        return tuple(dict.fromkeys(terms))
+    
+    @staticmethod
+    def _snapshot_candidates(page, snapshot: Dict[str, list], search_terms: Tuple[str, ...]) -> list:
+        """
+        Locators for the fields the snapshot links to the search terms, in strategy order
+        """
+        candidates = []
+        
+        # By aria-label: terms in priority order, first aria-labelled field matching the term
+        aria_match = next(
+            (entry for term in search_terms for entry in snapshot['aria'] if term in entry['label']),
+            None
+        )
+        if aria_match:
+            candidates.append((page.locator(aria_match['selector']).first, 'aria-label'))
+        
+        # First label whose text contains each term
+        term_labels = []
+        for term in search_terms:
+            for entry in snapshot['labels']:
+                if term in entry['text']:
+                    term_labels.append(entry)
+                    break
+        
+        # By aria-labelledby, then by label[for]
+        for key, strategy in (('labelledby_target', 'aria-labelledby'), ('for_target', 'label')):
+            for entry in term_labels:
+                if entry[key]:
+                    candidates.append((page.locator(entry[key]).first, strategy))
+        
+        return candidates
     
     @staticmethod
     async def smart_fill(page, field_name: str, value: str) -> bool:
@@ -82,75 +253,44 @@ class TextFieldFiller:
         """
         search_terms = TextFieldFiller._get_search_terms(field_name)
         
-        # Try by aria-label
-        for term in search_terms:
+        # A cached snapshot goes stale when the form re-renders, so when none of its
+        # candidates is on the page any more it is retaken once
+        for refresh in (False, True):
             try:
-                input_locator = page.locator(f'input[aria-label*="{term}" i], textarea[aria-label*="{term}" i]').first
-                if await input_locator.count() > 0:
-                    await input_locator.scroll_into_view_if_needed()
+                snapshot = await TextFieldFiller._get_label_snapshot(page, refresh=refresh)
+            except Exception:
+                snapshot = {'labels': [], 'aria': []}
+            
+            found = False
+            for input_locator, strategy in TextFieldFiller._snapshot_candidates(page, snapshot, search_terms):
+                try:
+                    if await input_locator.count() == 0:
+                        continue
+                    found = True
+                    if await input_locator.input_value(timeout=2000) == value:
+                        print(f'✅ {field_name}: \'{value}\' (smart: {strategy}, already set)')
+                        return True
+                    await TextFieldFiller._scroll_into_view(page, input_locator)
                     await input_locator.focus()
-                    await input_locator.clear()
                     await input_locator.fill(value)
-                    print(f'✅ {field_name}: \'{value}\' (smart: aria-label)')
+                    print(f'✅ {field_name}: \'{value}\' (smart: {strategy})')
                     return True
-            except Exception:
-                continue
-        
-        # Try by aria-labelledby
-        for term in search_terms:
-            try:
-                label = page.locator(f'label:has-text("{term}") i').first
-                if await label.count() > 0:
-                    label_id = await label.get_attribute('id')
-                    if label_id:
-                        input_locator = page.locator(f'[aria-labelledby="{label_id}"]').first
-                        if await input_locator.count() > 0:
-                            await input_locator.scroll_into_view_if_needed()
-                            await input_locator.focus()
-                            await input_locator.clear()
-                            await input_locator.fill(value)
-                            print(f'✅ {field_name}: \'{value}\' (smart: aria-labelledby)')
-                            return True
-            except Exception:
-                continue
-        
-        # Try by label
-        for term in search_terms:
-            try:
-                label = page.locator(f'label:has-text("{term}") i').first
-                label_for = await label.get_attribute('for')
-                if label_for:
-                    input_locator = page.locator(f'#{label_for}').first
-                    if await input_locator.count() > 0:
-                        await input_locator.scroll_into_view_if_needed()
-                        await input_locator.focus()
-                        await input_locator.clear()
-                        await input_locator.fill(value)
-                        print(f'✅ {field_name}: \'{value}\' (smart: label)')
-                        return True
-            except Exception:
-                continue
+                except Exception:
+                    continue
+            if found:
+                break
         
         # Try by autocomplete
-        autocomplete_map = {
-            'first name': 'given-name',
-            'vorname': 'given-name',
-            'last name': 'family-name',
-            'nachname': 'family-name',
-            'email': 'email',
-            'e-mail': 'email',
-            'phone': 'tel',
-            'telefon': 'tel'
-        }
-        
-        for key, autocomplete in autocomplete_map.items():
-            if key in field_name.lower():
+        tried = set()
+        for match in _AUTOCOMPLETE_RE.finditer(field_name.lower()):
+            autocomplete = _AUTOCOMPLETE_MAP[match.group(0)]
+            if autocomplete not in tried:
+                tried.add(autocomplete)
                 try:
                     input_locator = page.locator(f'input[autocomplete="{autocomplete}"], input[autocomplete*="{autocomplete}"]').first
                     if await input_locator.count() > 0:
-                        await input_locator.scroll_into_view_if_needed()
+                        await TextFieldFiller._scroll_into_view(page, input_locator)
                         await input_locator.focus()
-                        await input_locator.clear()
                         await input_locator.fill(value)
                         print(f'✅ {field_name}: \'{value}\' (smart: autocomplete)')
                         return True
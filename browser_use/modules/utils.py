@@ -4,7 +4,16 @@ Utility functions for form filling
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional, Union
+
+# Relative upload paths resolve against the browser_use package directory by default
+_DEFAULT_BASE = Path(__file__).resolve().parent.parent
+
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_DOTTED_DATE_RE = re.compile(r'^\d{2}\.\d{2}\.\d{4}$')
+_YEAR_RE = re.compile(r'^\d{4}$')
 
 
 def normalize_date(date_value: str) -> str:
@@ -15,32 +24,25 @@ def normalize_date(date_value: str) -> str:
         return ''
     
     # Already in YYYY-MM-DD format
-    if re.match(r'^\d{4}-\d{2}-\d{2}$', date_value):
+    if _ISO_DATE_RE.match(date_value):
         return date_value
     
     # DD.MM.YYYY format
-    if re.match(r'^\d{2}\.\d{2}\.\d{4}$', date_value):
+    if _DOTTED_DATE_RE.match(date_value):
         parts = date_value.split('.')
         return f"{parts[2]}-{parts[1]}-{parts[0]}"
     
     # YYYY format only
-    if re.match(r'^\d{4}$', date_value):
+    if _YEAR_RE.match(date_value):
         return f"{date_value}-01-01"
     
-    # Try parsing as date
-    try:
-        from datetime import datetime
-        date = datetime.strptime(date_value, '%Y-%m-%d')
-        return date.strftime('%Y-%m-%d')
-    except:
-        pass
-    
     return date_value
 
 
+@lru_cache(maxsize=512)
 def resolve_file_path(file_path: str, base_dir: str = None) -> str:
     """
-    Resolve file path (relative or absolute)
+    Resolve file path (relative or absolute), cached per (file_path, base_dir)
     """
     if not file_path:
         return ''
@@ -49,11 +51,8 @@ def resolve_file_path(file_path: str, base_dir: str = None) -> str:
     if os.path.isabs(file_path):
         return file_path
     
-    # If relative path, resolve from base_dir or current directory
-    if base_dir:
-        base = Path(base_dir)
-    else:
-        base = Path(__file__).parent.parent
+    # If relative path, resolve from base_dir or the package directory
+    base = Path(base_dir) if base_dir else _DEFAULT_BASE
     
     resolved = base / file_path
     return str(resolved.resolve())
@@ -73,11 +72,13 @@ def get_date_formats(year: str, month: str, day: str) -> list:
     ]
 
 
-def validate_date(current_value: str, expected_date: str, year: str, month: str, day: str) -> bool:
+def validate_date(current_value: str, expected_date: str,
+                  year: Union[str, int], month: Union[str, int], day: Union[str, int]) -> bool:
     """
     Validate if the filled date matches expected date
+    year/month/day may be passed as strings or as already-parsed ints
     """
-    if not current_value or len(current_value) == 0:
+    if not current_value:
         return False
     
     # Normalize current value
@@ -85,24 +86,226 @@ def validate_date(current_value: str, expected_date: str, year: str, month: str,
     if normalized_current == expected_date:
         return True
     
+    year = str(year)
+    month_num = int(month)
+    day_num = int(day)
+    month = f'{month_num:02d}'
+    day = f'{day_num:02d}'
+    
     # Check if year, month, and day match
     parts = normalized_current.split('-')
-    if len(parts) == 3:
-        current_year, current_month, current_day = parts
-        if current_year == year and current_month == month and current_day == day:
+    if len(parts) == 3 and parts[0] == year and parts[1] == month and parts[2] == day:
+        return True
+    
+    # Check common date formats: DD.MM.YYYY and DD/MM/YYYY, with and without zeros
+    for candidate in (
+        f"{day_num}.{month_num}.{year}",
+        f"{day}.{month}.{year}",
+        f"{day_num}/{month_num}/{year}",
+        f"{day}/{month}/{year}",
+    ):
+        if candidate in current_value:
             return True
     
-    # Check common date formats
-    day_num = int(day)
-    month_num = int(month)
+    return False
+
+
+# In-page helpers shared by the fillers, installed once per page so per-field calls only
+# send a function name and arguments instead of the whole script
+_PAGE_HELPERS_JS = """
+(() => {
+    if (window.__autoFormFill) return;
     
-    # DD.MM.YYYY format
-    if f"{day_num}.{month_num}.{year}" in current_value or f"{day}.{month}.{year}" in current_value:
-        return True
+    // dispatchEvent runs the page's listeners synchronously, so they have handled the
+    // change by the time this returns; nothing to wait for
+    const fire = (select) => {
+        select.dispatchEvent(new Event('change', { bubbles: true, cancelable: true }));
+        select.dispatchEvent(new Event('input', { bubbles: true, cancelable: true }));
+    };
     
-    # DD/MM/YYYY format
-    if f"{day_num}/{month_num}/{year}" in current_value or f"{day}/{month}/{year}" in current_value:
-        return True
+    // Same comparison key as _normalize in select_filler.py: upper- then lower-casing
+    // folds the way str.casefold() does (e.g. 'ß' -> 'ss')
+    const norm = (text) => String(text || '').trim().toUpperCase().toLowerCase();
     
-    return False
+    window.__autoFormFill = {
+        // Select the option matching the earliest entry of `values` (already normalized),
+        // so the caller's priority order wins over DOM order
+        selectByValues(select, values) {
+            if (!select || !select.options) return { ok: false, value: null };
+            const keys = Array.from(select.options, o => norm(o.value));
+            let i = -1;
+            for (const value of values) {
+                i = keys.indexOf(value);
+                if (i !== -1) break;
+            }
+            if (i === -1) return { ok: false, value: null };
+            select.value = select.options[i].value;
+            fire(select);
+            return { ok: select.value === select.options[i].value, value: select.value };
+        },
+        
+        // Select the option with this value, exact match first, then case-insensitive
+        selectByValue(select, optionValue) {
+            if (!select || !select.options) return { ok: false, value: null };
+            const target = String(optionValue);
+            const opts = Array.from(select.options, o => ({ v: String(o.value), vl: String(o.value).toLowerCase() }));
+            let i = opts.findIndex(o => o.v === target);
+            if (i === -1) {
+                const targetLower = target.toLowerCase();
+                i = opts.findIndex(o => o.vl === targetLower);
+            }
+            if (i === -1) return { ok: false, value: null };
+            select.value = select.options[i].value;
+            fire(select);
+            return { ok: select.value === select.options[i].value, value: select.value };
+        }
+    };
+})()
+"""
+
+
+async def ensure_helpers(page) -> None:
+    """
+    Install window.__autoFormFill on the page once: as an init script, so every later
+    document gets it, and evaluated right away for the current document
+    """
+    if getattr(page, '_autoff_installed', False):
+        return
+    await page.add_init_script(_PAGE_HELPERS_JS)
+    await page.evaluate(_PAGE_HELPERS_JS)
+    page._autoff_installed = True
+
+
+# Resource types the fillers never look at. Stylesheets are deliberately kept: visibility
+# checks (custom selects, hidden file inputs) depend on the page's CSS
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'texttrack', 'beacon', 'csp_report', 'imageset'})
+
+
+async def _route_blocking_heavy_resources(route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def block_heavy_resources(context) -> None:
+    """
+    Abort image/font/media/beacon requests for every page of the browser context
+    Registered once per context, so it also covers later navigations and popups
+    """
+    if getattr(context, '_autoff_blocking', False):
+        return
+    await context.route('**/*', _route_blocking_heavy_resources)
+    context._autoff_blocking = True
+
+
+async def unblock_heavy_resources(context) -> None:
+    """Remove the route installed by block_heavy_resources, for contexts shared with other code"""
+    if not getattr(context, '_autoff_blocking', False):
+        return
+    await context.unroute('**/*', _route_blocking_heavy_resources)
+    context._autoff_blocking = False
+
+
+# Scroll a URL #fragment target into view. One querySelectorAll pass collects every
+# candidate, then the most specific match wins: id, then name, then partial id/name.
+# The fragment is CSS-escaped, so values like "!/job/(…)/apply/" can't break the selector
+SCROLL_TO_ANCHOR_JS = """
+(anchor) => {
+    const a = CSS.escape(anchor);
+    const ranked = [`#${a}`, `[name="${a}"]`, `[id*="${a}"], [name*="${a}"]`];
+    const found = Array.from(document.querySelectorAll(ranked.join(', ')));
+    for (const sel of ranked) {
+        const el = found.find(e => e.matches(sel));
+        if (el) {
+            el.scrollIntoView({ behavior: 'instant', block: 'center' });
+            return true;
+        }
+    }
+    return false;
+}
+"""
+
+_ANCHOR_SCROLLER_INIT_JS = f'window.__scrollToAnchor = {SCROLL_TO_ANCHOR_JS.strip()};'
+
+
+async def install_anchor_scroller(context) -> None:
+    """
+    Define window.__scrollToAnchor in every document of the context, so scrolling to
+    an anchor only sends the anchor, not the script
+    """
+    if getattr(context, '_autoff_anchor_scroller', False):
+        return
+    await context.add_init_script(_ANCHOR_SCROLLER_INIT_JS)
+    context._autoff_anchor_scroller = True
+
+
+async def scroll_to_anchor(page, anchor: str) -> bool:
+    """
+    Scroll the element named by a URL #fragment into view
+    Uses the installed window.__scrollToAnchor, or the full script on pages opened before
+    install_anchor_scroller() ran
+    """
+    scrolled = await page.evaluate(
+        '(a) => window.__scrollToAnchor ? window.__scrollToAnchor(a) : null', anchor
+    )
+    if scrolled is None:
+        scrolled = await page.evaluate(SCROLL_TO_ANCHOR_JS, anchor)
+    return scrolled
+
+
+# Visible cookie/consent UI left on the page; used to decide whether a second consent pass is needed
+COOKIE_BANNER_SELECTOR = 'button:has-text("Accept"):visible, [id*="cookie"]:visible, [class*="consent"]:visible'
 
+
+# Drop media and ad/tracker/video-embed iframes before the fillers walk the DOM, shrinking
+# every querySelectorAll they run. Same-origin and unknown iframes stay: application forms
+# and reCAPTCHA are often embedded from other origins
+PRUNE_DOM_JS = """
+() => {
+    const junkFrame = /doubleclick\\.net|googlesyndication\\.com|googletagmanager\\.com|google-analytics\\.com|facebook\\.com\\/tr|youtube(-nocookie)?\\.com\\/embed|player\\.vimeo\\.com/;
+    let removed = 0;
+    document.querySelectorAll('video, audio').forEach(el => { el.remove(); removed++; });
+    document.querySelectorAll('iframe[src]').forEach(el => {
+        if (junkFrame.test(el.src)) { el.remove(); removed++; }
+    });
+    return removed;
+}
+"""
+
+# Any cookie/consent wrapper; its absence means there is no consent popup to handle
+COOKIE_WRAPPER_SELECTOR = '[id*="cookie"], [class*="cookie"], [id*="consent"], [class*="consent"], [aria-label*="cookie" i], [data-testid*="cookie"]'
+
+
+async def screenshot_form(page, path: str) -> None:
+    """
+    Screenshot only the first <form> (clipped to its box), or the full page if there is
+    no visible form; a long job page is often several times taller than its form
+    """
+    form = page.locator('form').first
+    try:
+        if await form.bounding_box() is not None:
+            await form.screenshot(path=path, timeout=5000)
+            return
+    except Exception:
+        pass
+    await page.screenshot(path=path, full_page=True)
+
+
+# Elements that show up once a submitted form was either rejected or accepted
+SUBMIT_ERROR_SELECTOR = '.error, [aria-invalid="true"], .is-invalid, .invalid-feedback'
+SUBMIT_SUCCESS_SELECTOR = '.thank-you, .success'
+
+
+async def wait_for_submit_outcome(page, timeout: int = 10000) -> Optional[str]:
+    """
+    Wait until the page reacts to a submit instead of sleeping a fixed time
+    Returns 'error' or 'success' for whichever marker becomes visible first, or None
+    if neither appears within timeout
+    """
+    try:
+        hit = await page.wait_for_selector(f'{SUBMIT_ERROR_SELECTOR}, {SUBMIT_SUCCESS_SELECTOR}', timeout=timeout)
+        is_error = await hit.evaluate('(el, sel) => el.matches(sel)', SUBMIT_ERROR_SELECTOR)
+    except Exception:
+        return None
+    return 'error' if is_error else 'success'
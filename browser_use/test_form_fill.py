@@ -4,6 +4,7 @@ Test script for form filling
 
 import asyncio
 import sys
+import traceback
 from pathlib import Path
 
 # Add browser_use to path
@@ -12,29 +13,40 @@ sys.path.insert(0, str(Path(__file__).parent))
 from browser_use import Agent
 from browser_use.browser_use_form_tools import tools
 
+# Forms to fill; list the slowest portals first so they don't end up running alone at the end
+URLS = [
+    'https://www.finest-jobs.com/Bewerbung/Sales-Manager-D-Online-Marketing-727662?cp=BA',
+]
+
+# Maximum number of agents running at the same time
+MAX_PARALLEL = 5
+
+
+async def fill_one(url: str, sem: asyncio.Semaphore):
+    """Run one agent for url once a worker slot is free"""
+    async with sem:
+        print(f"🚀 Starting form filling for: {url}")
+        agent = Agent(
+            task=f"Fill the web form at {url} with data from config.json",
+            tools=tools
+        )
+        return await agent.run(url)
+
 
 async def main():
     """Main test function"""
-    url = 'https://www.finest-jobs.com/Bewerbung/Sales-Manager-D-Online-Marketing-727662?cp=BA'
-    
-    print(f"🚀 Starting form filling for: {url}\n")
-    
-    # Initialize Browser-Use Agent
-    agent = Agent(
-        task=f"Fill the web form at {url} with data from config.json",
-        tools=tools
-    )
-    
-    # Run the agent
-    try:
-        result = await agent.run(url)
-        print(f"\n✅ Result: {result}")
-    except Exception as e:
-        print(f"\n❌ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    sem = asyncio.Semaphore(MAX_PARALLEL)
+
+    # Run the agents concurrently, at most MAX_PARALLEL at once
+    results = await asyncio.gather(*(fill_one(url, sem) for url in URLS), return_exceptions=True)
+
+    for url, result in zip(URLS, results):
+        if isinstance(result, Exception):
+            print(f"\n❌ {url}\n   Error: {str(result)}")
+            traceback.print_exception(type(result), result, result.__traceback__)
+        else:
+            print(f"\n✅ {url}\n   Result: {result}")
 
 
 if __name__ == "__main__":
     asyncio.run(main())
-
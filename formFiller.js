@@ -18,6 +18,140 @@ import { FileUploadFiller } from './modules/FileUploadFiller.js';
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
+// Collects name, id, type and label of a field element in the page. Label strategies, in order:
+// label[for=id], parent label, previous sibling label, nearest label by position, then
+// aria-label or placeholder
+const FIELD_INFO_JS = (el) => {
+    const name = el.getAttribute('name');
+    const id = el.getAttribute('id');
+    const placeholder = el.getAttribute('placeholder');
+    const ariaLabel = el.getAttribute('aria-label');
+    const type = el.getAttribute('type');
+    const tagName = el.tagName.toLowerCase();
+    
+    let label = null;
+    
+    // Strategy 1: Label with 'for' attribute pointing to this field's id
+    if (id) {
+        try {
+            const labelElement = document.querySelector(`label[for="${CSS.escape(id)}"]`);
+            if (labelElement) {
+                label = labelElement.textContent;
+            }
+        } catch (e) {}
+    }
+    
+    // Strategy 2: Parent label element
+    if (!label) {
+        const parentLabel = el.closest('label');
+        if (parentLabel) {
+            label = parentLabel.textContent;
+        }
+    }
+    
+    // Strategy 3: Previous sibling label (common pattern: <label>Text</label><input>)
+    if (!label) {
+        let sibling = el.previousElementSibling;
+        while (sibling && sibling.tagName !== 'LABEL') {
+            sibling = sibling.previousElementSibling;
+        }
+        if (sibling) {
+            label = sibling.textContent;
+        }
+    }
+    
+    // Strategy 4: Find label by text near the field (using position)
+    if (!label) {
+        const fieldPosition = el.getBoundingClientRect();
+        for (const labelEl of document.querySelectorAll('label')) {
+            const labelPos = labelEl.getBoundingClientRect();
+            
+            // Check if label is above or to the left of the field (within reasonable distance)
+            const isNear = (
+                (labelPos.top < fieldPosition.top + fieldPosition.height + 10 && labelPos.top + labelPos.height > fieldPosition.top - 10) ||
+                (labelPos.left < fieldPosition.left + fieldPosition.width + 10 && labelPos.left + labelPos.width > fieldPosition.left - 10)
+            );
+            
+            if (isNear && Math.abs(labelPos.top - fieldPosition.top) < 50) {
+                const labelText = labelEl.textContent;
+                if (labelText && labelText.trim()) {
+                    label = labelText.trim();
+                    break;
+                }
+            }
+        }
+    }
+    
+    // Fallback to aria-label or placeholder
+    if (!label) {
+        label = ariaLabel || placeholder;
+    }
+    
+    return {
+        name,
+        id,
+        label: label ? label.trim() : null,
+        type: type || tagName,
+        tagName
+    };
+};
+
+// Chromium flags that skip work irrelevant to filling a form
+const LEAN_LAUNCH_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--disable-blink-features=AutomationControlled'
+];
+
+// Request types aborted when settings.lean_loading is on; stylesheets still load because
+// visibility checks depend on them
+const BLOCKED_RESOURCE_TYPES = new Set(['image', 'font', 'media']);
+
+// File uploads in the order they are done; the photo input often only appears after the CV upload
+const FILE_UPLOAD_PLAN = [
+    {
+        key: 'resume',
+        name: 'CV/Resume',
+        icon: '📄',
+        selectors: [
+            'input[name="file_app_map"]',
+            'input[name="file-upload"]',
+            'input[type="file"][name*="resume"]',
+            'input[type="file"][name*="cv"]',
+            'input[type="file"][name*="lebenslauf"]'
+        ],
+        waitAfter: 3000,
+        failMessage: '❌ CV/Resume upload failed'
+    },
+    {
+        key: 'cover_letter',
+        name: 'Cover Letter',
+        icon: '📄',
+        selectors: [
+            'input[name="file_cover_letter"]',
+            'input[type="file"][name*="cover"]',
+            'input[type="file"][name*="motivation"]',
+            'input[type="file"][name*="anschreiben"]'
+        ],
+        waitAfter: 3000,
+        failMessage: '❌ Cover Letter upload failed'
+    },
+    {
+        key: 'photo',
+        name: 'Photo',
+        icon: '📷',
+        selectors: [
+            'input[name="file_photo"]',
+            'input[type="file"][name*="photo"]',
+            'input[type="file"][name*="foto"]',
+            'input[type="file"][name*="bild"]',
+            'input[type="file"][name*="profile"]'
+        ],
+        waitBefore: 2000, // Wait a bit more
+        failMessage: '⚠️  Photo upload failed (might not be visible yet)'
+    }
+];
+
 class FormFiller {
     /**
      * Initialize FormFiller with configuration file.
@@ -27,6 +161,34 @@ class FormFiller {
         this.configPath = configPath;
         this.config = this._loadConfig();
         this.browser = null;
+        this.context = null;
+        this.page = null;
+    }
+
+    /**
+     * Launch the browser on first use and reuse it for every later fillForm call.
+     * @param {boolean} headless - Launch without a visible window
+     * @returns {Promise<Object>} Browser instance
+     */
+    async _ensureBrowser(headless) {
+        if (!this.browser || !this.browser.isConnected()) {
+            this.browser = await chromium.launch({ headless, args: LEAN_LAUNCH_ARGS });
+        }
+        return this.browser;
+    }
+
+    /**
+     * Close the current context and the shared browser.
+     */
+    async close() {
+        if (this.context) {
+            await this.context.close().catch(() => {});
+            this.context = null;
+        }
+        if (this.browser) {
+            await this.browser.close().catch(() => {});
+            this.browser = null;
+        }
         this.page = null;
     }
 
@@ -54,10 +216,21 @@ class FormFiller {
      * @param {boolean} autoSubmit - If true, automatically submits the form after filling
      */
     async fillForm(url, autoSubmit = false) {
-        // Launch browser based on settings
+        // Reuse the browser across calls; each form gets a fresh context. The previous form's
+        // context is closed here rather than at the end, so it stays open for review
         const headless = this.config.settings?.headless || false;
-        this.browser = await chromium.launch({ headless });
-        this.page = await this.browser.newPage();
+        await this._ensureBrowser(headless);
+        if (this.context) {
+            await this.context.close().catch(() => {});
+        }
+        this.context = await this.browser.newContext();
+        if (this.config.settings?.lean_loading) {
+            // Skip downloading images, fonts and media; none of it is needed to fill the form
+            await this.context.route('**/*', route => (
+                BLOCKED_RESOURCE_TYPES.has(route.request().resourceType()) ? route.abort() : route.continue()
+            ));
+        }
+        this.page = await this.context.newPage();
 
         try {
             console.log(`🌐 Navigating to: ${url}`);
@@ -68,9 +241,12 @@ class FormFiller {
                 timeout: 90000 // Increased timeout to 90 seconds
             });
 
-            // Wait for page to fully load
-            const waitTimeout = this.config.settings?.wait_timeout || 5000; // Increased default wait time
-            await this.page.waitForTimeout(waitTimeout);
+            // Wait for the form itself instead of a fixed settings.wait_timeout delay
+            try {
+                await this.page.waitForSelector("form, input[type='email'], input[name*='name' i]", { timeout: 10000 });
+            } catch (error) {
+                console.log('⚠️  No form fields yet, continuing');
+            }
 
             // Handle cookie consent popup - try multiple times with delays
             // Cookie popups often appear with delay after page load
@@ -145,10 +321,7 @@ class FormFiller {
             // Close popup/modal if exists (for empfehlungsbund.de)
             // await this._closePopup();
 
-            // Wait a bit more for form to be visible after popup closes
-            await this.page.waitForTimeout(3000);
-            
-            // Try to wait for form to be visible
+            // Wait for form to be visible; returns as soon as it is, so no fixed delay before it
             let formDetected = false;
             try {
                 await this.page.waitForSelector('form, input[name*="name"], input[name*="email"]', { 
@@ -240,12 +413,16 @@ class FormFiller {
             // TEMPORARILY COMMENTED: Only focus on file uploads (for debugging)
             // await this._fillFileUploadsOnly();
 
-            // Take screenshot before submission (for verification)
-            await this.page.screenshot({ 
-                path: 'form_filled.png', 
-                fullPage: true 
-            });
-            console.log('📸 Screenshot saved: form_filled.png');
+            // Take screenshot before submission (for verification), only if configured;
+            // a viewport JPEG is far cheaper to render and encode than a full-page PNG
+            if (this.config.settings?.screenshot_after_fill) {
+                await this.page.screenshot({ 
+                    path: 'form_filled.jpg', 
+                    type: 'jpeg',
+                    quality: 70
+                });
+                console.log('📸 Screenshot saved: form_filled.jpg');
+            }
 
             // Submit form if requested
             if (autoSubmit) {
@@ -263,12 +440,10 @@ class FormFiller {
             }
             await this._handleError();
         } finally {
-            // Keep browser open for manual review if not headless
-            if (headless || autoSubmit) {
-                // Keep browser open for review
-                // await this.browser.close();
+            // A visible browser stays open for manual review; a headless one is closed by the caller
+            if (!headless && autoSubmit) {
                 console.log('\n🌐 Browser will remain open for review. Close manually when done.');
-            } else {
+            } else if (!headless) {
                 console.log('🔍 Browser kept open for manual review. Close it when done.');
             }
         }
@@ -289,11 +464,15 @@ class FormFiller {
         
         console.log(`\n📋 Found ${fields.length} form fields. Processing in order...\n`);
         
+        // Read every field's info concurrently, once; the reads are independent while the fills
+        // below stay sequential because they share focus and can reveal new fields
+        const fieldInfos = await Promise.all(fields.map(field => this._getFieldInfo(field).catch(() => null)));
+        
         // First, log all fields with their raw info for debugging
         console.log('🔍 All discovered fields (before processing):');
         for (let i = 0; i < fields.length; i++) {
             try {
-                const fieldInfo = await this._getFieldInfo(fields[i]);
+                const fieldInfo = fieldInfos[i];
                 const fieldLabel = fieldInfo.label || fieldInfo.name || fieldInfo.id || `Field #${i + 1}`;
                 const debugInfo = [];
                 if (fieldInfo.name) debugInfo.push(`name="${fieldInfo.name}"`);
@@ -311,8 +490,9 @@ class FormFiller {
         const processedFieldNames = new Set();
         
         // Now process fields
-        for (const field of fields) {
-            const fieldInfo = await this._getFieldInfo(field);
+        for (let i = 0; i < fields.length; i++) {
+            const field = fields[i];
+            const fieldInfo = fieldInfos[i] || await this._getFieldInfo(field);
             const configValue = this._getConfigValueForField(fieldInfo, personalInfo, filePaths, questions, talentPool);
             
             // Handle checkbox for talent pool (app_register) - but don't skip, let it be processed normally too
@@ -756,59 +936,22 @@ class FormFiller {
         
         const filePaths = this.config.file_paths || {};
         
-        // CV / Resume
-        if (filePaths.resume) {
-            console.log('📄 Uploading CV/Resume...');
-            const resumeSelectors = [
-                'input[name="file_app_map"]',
-                'input[name="file-upload"]',
-                'input[type="file"][name*="resume"]',
-                'input[type="file"][name*="cv"]',
-                'input[type="file"][name*="lebenslauf"]'
-            ];
-            const uploaded = await FileUploadFiller.fill(this.page, resumeSelectors, filePaths.resume, 'CV/Resume');
-            if (uploaded) {
-                console.log('✅ CV/Resume uploaded successfully');
-                await this.page.waitForTimeout(3000); // Wait for any dynamic content
-            } else {
-                console.log('❌ CV/Resume upload failed');
+        for (const step of FILE_UPLOAD_PLAN) {
+            if (!filePaths[step.key]) {
+                continue;
             }
-        }
-        
-        // Cover Letter
-        if (filePaths.cover_letter) {
-            console.log('\n📄 Uploading Cover Letter...');
-            const coverLetterSelectors = [
-                'input[name="file_cover_letter"]',
-                'input[type="file"][name*="cover"]',
-                'input[type="file"][name*="motivation"]',
-                'input[type="file"][name*="anschreiben"]'
-            ];
-            const uploaded = await FileUploadFiller.fill(this.page, coverLetterSelectors, filePaths.cover_letter, 'Cover Letter');
-            if (uploaded) {
-                console.log('✅ Cover Letter uploaded successfully');
-                await this.page.waitForTimeout(3000); // Wait for any dynamic content
-            } else {
-                console.log('❌ Cover Letter upload failed');
+            console.log(`\n${step.icon} Uploading ${step.name}...`);
+            if (step.waitBefore) {
+                await this.page.waitForTimeout(step.waitBefore);
             }
-        }
-        
-        // Photo (might appear after CV upload)
-        if (filePaths.photo) {
-            console.log('\n📷 Uploading Photo...');
-            await this.page.waitForTimeout(2000); // Wait a bit more
-            const photoSelectors = [
-                'input[name="file_photo"]',
-                'input[type="file"][name*="photo"]',
-                'input[type="file"][name*="foto"]',
-                'input[type="file"][name*="bild"]',
-                'input[type="file"][name*="profile"]'
-            ];
-            const uploaded = await FileUploadFiller.fill(this.page, photoSelectors, filePaths.photo, 'Photo');
+            const uploaded = await FileUploadFiller.fill(this.page, step.selectors, filePaths[step.key], step.name);
             if (uploaded) {
-                console.log('✅ Photo uploaded successfully');
+                console.log(`✅ ${step.name} uploaded successfully`);
+                if (step.waitAfter) {
+                    await this.page.waitForTimeout(step.waitAfter); // Wait for any dynamic content
+                }
             } else {
-                console.log('⚠️  Photo upload failed (might not be visible yet)');
+                console.log(step.failMessage);
             }
         }
         
@@ -1452,105 +1595,8 @@ class FormFiller {
      */
     async _getFieldInfo(locator) {
         try {
-            const name = await locator.getAttribute('name').catch(() => null);
-            const id = await locator.getAttribute('id').catch(() => null);
-            const placeholder = await locator.getAttribute('placeholder').catch(() => null);
-            const ariaLabel = await locator.getAttribute('aria-label').catch(() => null);
-            const type = await locator.getAttribute('type').catch(() => null);
-            const tagName = await locator.evaluate(el => el.tagName.toLowerCase()).catch(() => null);
-            
-            // Get label text - try multiple strategies
-            let label = null;
-            
-            // Strategy 1: Label with 'for' attribute pointing to this field's id
-            if (id) {
-                try {
-                    const labelElement = this.page.locator(`label[for="${id}"]`).first();
-                    if (await labelElement.count() > 0) {
-                        label = await labelElement.textContent();
-                    }
-                } catch (error) {
-                    // Ignore
-                }
-            }
-            
-            // Strategy 2: Parent label element
-            if (!label) {
-                try {
-                    const parentLabel = locator.locator('xpath=ancestor::label').first();
-                    if (await parentLabel.count() > 0) {
-                        label = await parentLabel.textContent();
-                    }
-                } catch (error) {
-                    // Ignore
-                }
-            }
-            
-            // Strategy 3: Previous sibling label (common pattern: <label>Text</label><input>)
-            if (!label) {
-                try {
-                    const prevLabel = locator.locator('xpath=preceding-sibling::label[1]').first();
-                    if (await prevLabel.count() > 0) {
-                        label = await prevLabel.textContent();
-                    }
-                } catch (error) {
-                    // Ignore
-                }
-            }
-            
-            // Strategy 4: Find label by text near the field (using position)
-            if (!label) {
-                try {
-                    const fieldPosition = await locator.evaluate(el => {
-                        const rect = el.getBoundingClientRect();
-                        return { x: rect.left, y: rect.top, width: rect.width, height: rect.height };
-                    }).catch(() => null);
-                    
-                    if (fieldPosition) {
-                        // Find all labels and check which one is closest to this field
-                        const allLabels = await this.page.locator('label').all();
-                        for (const labelEl of allLabels) {
-                            try {
-                                const labelPos = await labelEl.evaluate(el => {
-                                    const rect = el.getBoundingClientRect();
-                                    return { x: rect.left, y: rect.top, width: rect.width, height: rect.height };
-                                });
-                                
-                                // Check if label is above or to the left of the field (within reasonable distance)
-                                const isNear = (
-                                    (labelPos.y < fieldPosition.y + fieldPosition.height + 10 && labelPos.y + labelPos.height > fieldPosition.y - 10) ||
-                                    (labelPos.x < fieldPosition.x + fieldPosition.width + 10 && labelPos.x + labelPos.width > fieldPosition.x - 10)
-                                );
-                                
-                                if (isNear && Math.abs(labelPos.y - fieldPosition.y) < 50) {
-                                    const labelText = await labelEl.textContent();
-                                    if (labelText && labelText.trim()) {
-                                        label = labelText.trim();
-                                        break;
-                                    }
-                                }
-                            } catch (error) {
-                                continue;
-                            }
-                        }
-                    }
-                } catch (error) {
-                    // Ignore
-                }
-            }
-            
-            // Fallback to aria-label or placeholder
-            if (!label) {
-                label = ariaLabel || placeholder;
-            }
-            
-            return {
-                name,
-                id,
-                label: label ? label.trim() : null,
-                type: type || tagName,
-                tagName
-            };
+            // One round trip per field: attributes and all label strategies run inside the page
+            return await locator.evaluate(FIELD_INFO_JS);
         } catch (error) {
             return { name: null, id: null, label: null, type: 'unknown', tagName: null };
         }
@@ -1949,7 +1995,6 @@ class FormFiller {
             } else {
                 // Text, email, tel, textarea, etc. - use locator directly
                 try {
-                    await locator.clear();
                     await locator.fill(value);
                     // Verify the value was set
                     const currentValue = await locator.inputValue().catch(() => '');
@@ -2176,6 +2221,40 @@ class FormFiller {
         return false;
     }
 
+    /**
+     * Wait once for any of the selectors to become visible instead of waiting on each in turn.
+     * All candidates are raced; afterwards the ones that are visible are returned in selector
+     * order, so the first listed selector still wins when several match.
+     * @param {string[]} selectors - List of CSS selectors to try
+     * @param {number} timeout - Maximum time to wait for the first visible match
+     * @returns {Promise<{selector: string, locator: Object}[]>} Visible candidates
+     */
+    async _raceVisible(selectors, timeout) {
+        const candidates = selectors.map(selector => ({
+            selector,
+            locator: this.page.locator(selector).first()
+        }));
+        const visibleNow = async () => {
+            const visible = await Promise.all(candidates.map(c => c.locator.isVisible().catch(() => false)));
+            return candidates.filter((c, i) => visible[i]);
+        };
+        
+        // Fast path: on an already rendered form the field is there now, no waiting needed
+        const found = await visibleNow();
+        if (found.length > 0) {
+            return found;
+        }
+        
+        try {
+            await Promise.any(candidates.map(c => c.locator.waitFor({ state: 'visible', timeout })));
+        } catch (error) {
+            // None became visible in time
+            return [];
+        }
+        
+        return await visibleNow();
+    }
+
     /**
      * Try to find and fill a field using multiple selector strategies.
      * Enhanced with smart field detection for global form support.
@@ -2185,12 +2264,10 @@ class FormFiller {
      * @returns {Promise<boolean>} True if field was found and filled
      */
     async _fillField(selectors, value, fieldName = '') {
-        for (const selector of selectors) {
+        // One shared 3s wait for all selectors instead of up to 3s per selector
+        const candidates = await this._raceVisible(selectors, 3000);
+        for (const { selector, locator } of candidates) {
             try {
-                // Wait for element to be visible and attached to DOM
-                const locator = this.page.locator(selector).first();
-                await locator.waitFor({ state: 'visible', timeout: 3000 });
-                
                 // Check if element exists
                 const count = await locator.count();
                 if (count > 0) {
@@ -2202,11 +2279,7 @@ class FormFiller {
                     await locator.focus();
                     await this.page.waitForTimeout(100);
                     
-                    // Clear existing value
-                    await locator.clear();
-                    await this.page.waitForTimeout(100);
-                    
-                    // Fill the value
+                    // Fill the value (fill() clears the existing value itself)
                     await locator.fill(value);
                     await this.page.waitForTimeout(100);
                     
@@ -2259,7 +2332,6 @@ class FormFiller {
                         if (await input.count() > 0) {
                             await input.scrollIntoViewIfNeeded();
                             await input.focus();
-                            await input.clear();
                             await input.fill(value);
                             console.log(`✅ ${fieldName}: '${value}' (found by label)`);
                             return true;
@@ -2291,7 +2363,6 @@ class FormFiller {
                         if (await input.count() > 0) {
                             await input.scrollIntoViewIfNeeded();
                             await input.focus();
-                            await input.clear();
                             await input.fill(value);
                             console.log(`✅ ${fieldName}: '${value}' (found by autocomplete)`);
                             return true;
@@ -2309,7 +2380,6 @@ class FormFiller {
                     if (await input.count() > 0) {
                         await input.scrollIntoViewIfNeeded();
                         await input.focus();
-                        await input.clear();
                         await input.fill(value);
                         console.log(`✅ ${fieldName}: '${value}' (found by placeholder)`);
                         return true;
@@ -2334,7 +2404,6 @@ class FormFiller {
                         if (await input.count() > 0) {
                             await input.scrollIntoViewIfNeeded();
                             await input.focus();
-                            await input.clear();
                             await input.fill(value);
                             console.log(`✅ ${fieldName}: '${value}' (found by type)`);
                             return true;
@@ -2354,7 +2423,6 @@ class FormFiller {
                     if (await input.count() > 0) {
                         await input.scrollIntoViewIfNeeded();
                         await input.focus();
-                        await input.clear();
                         await input.fill(value);
                         console.log(`✅ ${fieldName}: '${value}' (found by name/id)`);
                         return true;
@@ -2469,7 +2537,6 @@ class FormFiller {
                         const formats = this._getDateFormats(year, month, day);
                         for (const format of formats) {
                             try {
-                                await locator.clear();
                                 await locator.fill(format);
                                 await this.page.waitForTimeout(100);
                                 await this.page.keyboard.press('Tab');
@@ -2644,7 +2711,6 @@ class FormFiller {
                             
                             // Fallback to direct fill
                             for (const format of formats) {
-                                await input.clear();
                                 await input.fill(format);
                                 await this.page.waitForTimeout(50);
                                 await this.page.keyboard.press('Tab');
@@ -2683,7 +2749,6 @@ class FormFiller {
                         
                         // Fallback to direct fill
                         for (const format of formats) {
-                            await input.clear();
                             await input.fill(format);
                             await this.page.waitForTimeout(50);
                             await this.page.keyboard.press('Tab');
@@ -2770,12 +2835,10 @@ class FormFiller {
             return false;
         }
 
-        for (const selector of selectors) {
+        const candidates = await this._raceVisible(selectors, 2000);
+        for (const { locator } of candidates) {
             try {
-                const element = await this.page.waitForSelector(selector, {
-                    timeout: 2000,
-                    state: 'visible'
-                });
+                const element = await locator.elementHandle();
                 
                 if (element) {
                     await element.setInputFiles(absPath);
@@ -3852,10 +3915,11 @@ class FormFiller {
         if (screenshotOnError) {
             try {
                 await this.page.screenshot({ 
-                    path: 'error_screenshot.png', 
-                    fullPage: true 
+                    path: 'error_screenshot.jpg', 
+                    type: 'jpeg',
+                    quality: 70
                 });
-                console.log('📸 Error screenshot saved: error_screenshot.png');
+                console.log('📸 Error screenshot saved: error_screenshot.jpg');
             } catch (error) {
                 // Ignore screenshot errors
             }
@@ -3865,11 +3929,14 @@ class FormFiller {
 
 /**
  * Main entry point for the script.
- * Modify the URL and settings as needed.
+ * URL, auto submit and config path come from the environment (FORM_URL, AUTO_SUBMIT,
+ * FORM_CONFIG) or the arguments (node formFiller.js <url> <true|false>), so callers such as
+ * run_js_form_filler.py can run this file as is. Modify the defaults below as needed.
  */
 async function main() {
     // Initialize form filler
-    const filler = new FormFiller('config.json');
+    const configPath = process.env.FORM_CONFIG || 'config.json';
+    const filler = new FormFiller(configPath);
 
     // URL of the form page
     // Previous URL (commented out):
@@ -3877,13 +3944,29 @@ async function main() {
     
     // New URL (commented out):
     // const url = 'https://www.heckertsolar.com/vertriebsaussendienst-m-w-d-dtld.-suedost/sw10146#custom-form-anchor';
-    const url = 'https://www.empfehlungsbund.de/jobs/283194/solution-manager-w-strich-m-strich-x';
+    const defaultUrl = 'https://www.empfehlungsbund.de/jobs/283194/solution-manager-w-strich-m-strich-x';
     
     // Original URL (empfehlungsbund.de):
     // const url = 'https://www.empfehlungsbund.de/jobs/283194/solution-manager-w-strich-m-strich-x';
 
-    // Fill the form (set autoSubmit=true to automatically submit)
-    await filler.fillForm(url, true);
+    const url = process.env.FORM_URL || process.argv[2] || defaultUrl;
+    // Auto submit unless told otherwise
+    const autoSubmitSetting = process.env.AUTO_SUBMIT || process.argv[3];
+    const autoSubmit = autoSubmitSetting === undefined || autoSubmitSetting === 'true';
+    
+    console.log('📋 Form Filler Configuration:');
+    console.log('   URL:', url);
+    console.log('   Auto Submit:', autoSubmit);
+    console.log('   Config:', configPath);
+    console.log('');
+
+    // Fill the form
+    await filler.fillForm(url, autoSubmit);
+
+    // A headless browser has nothing left to review, so end its lifecycle here
+    if (filler.config.settings?.headless) {
+        await filler.close();
+    }
 }
 
 // Run the script